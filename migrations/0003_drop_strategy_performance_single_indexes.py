@@ -0,0 +1,33 @@
+"""Drop single-column strategy_performance indexes covered by composite indexes.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+depends_on = None
+
+
+def upgrade():
+    # idx_strategy_performance_name_period (from 0002) leads with strategy_name and
+    # idx_strategy_performance_period leads with period_start, so both single-column
+    # indexes are redundant.
+    with op.batch_alter_table("strategy_performance") as batch_op:
+        batch_op.drop_index("ix_strategy_performance_strategy_name")
+        batch_op.drop_index("ix_strategy_performance_period_start")
+
+
+def downgrade():
+    # Recreate the single-column indexes created by 0002
+    with op.batch_alter_table("strategy_performance") as batch_op:
+        batch_op.create_index(
+            "ix_strategy_performance_strategy_name", ["strategy_name"], unique=False
+        )
+        batch_op.create_index(
+            "ix_strategy_performance_period_start", ["period_start"], unique=False
+        )
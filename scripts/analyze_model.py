@@ -5,7 +5,6 @@ from pathlib import Path
 import joblib
 import numpy as np
 import pandas as pd
-from sklearn.calibration import calibration_curve
 from sklearn.metrics import accuracy_score, brier_score_loss, log_loss, roc_auc_score
 
 try:
@@ -59,9 +58,12 @@ def analyze_model():
     # Build features
     print("2️⃣  Building features...")
     features = build_features(fixtures, odds)
-    features = features.merge(results, on="market_id", how="left")
-    features["label"] = (features["result"] == "home").astype(int)
-    features_clean = features.dropna(subset=["label"])
+    # Attach results by market position: one hash pass over the string IDs, then a
+    # positional take, instead of an object-dtype hash merge that copies the frame
+    result_pos = pd.Index(results["market_id"]).get_indexer(features["market_id"])
+    features["result"] = results["result"].array.take(result_pos, allow_fill=True)
+    features["label"] = (features["result"] == "home").astype(np.int8)
+    features_clean = features.dropna(subset=["result"])
     print(f"   Features: {len(features_clean.columns)} total\n")
 
     # Prepare data
@@ -77,12 +79,12 @@ def analyze_model():
     # Train model
     print("3️⃣  Training model...")
     model = ModelWrapper()
-    model.train(X_numeric.values, y)
+    model.train(X_numeric, y)
     print("   ✅ Model trained\n")
 
     # Make predictions
     print("4️⃣  Making predictions...")
-    y_pred_proba = model.predict_proba(X_numeric.values)[:, 1]
+    y_pred_proba = model.predict_pos_proba(X_numeric)
     y_pred = (y_pred_proba > 0.5).astype(int)
 
     # Calculate metrics
@@ -105,15 +107,29 @@ def analyze_model():
     print("  CALIBRATION ANALYSIS")
     print("=" * 70 + "\n")
 
-    prob_true, prob_pred = calibration_curve(y, y_pred_proba, n_bins=10)
+    # Uniform 10-bin reliability table (same binning as sklearn's calibration_curve),
+    # accumulated with bincount; empty bins are dropped before printing
+    n_cal_bins = 10
+    cal_idx = np.searchsorted(np.linspace(0.0, 1.0, n_cal_bins + 1)[1:-1], y_pred_proba)
+    cal_counts = np.bincount(cal_idx, minlength=n_cal_bins)
+    nonempty = cal_counts > 0
+    prob_pred = (
+        np.bincount(cal_idx, weights=y_pred_proba, minlength=n_cal_bins)[nonempty]
+        / cal_counts[nonempty]
+    )
+    prob_true = (
+        np.bincount(cal_idx, weights=y, minlength=n_cal_bins)[nonempty] / cal_counts[nonempty]
+    )
 
     print("Predicted vs Actual:")
     print(f"{'Predicted':<12} {'Actual':<12} {'Difference'}")
     print("-" * 40)
+    calibration_rows = []
     for pred, true in zip(prob_pred, prob_true):
         diff = abs(pred - true)
         symbol = "✅" if diff < 0.1 else "⚠️"
-        print(f"{pred:<12.2%} {true:<12.2%} {diff:>10.2%} {symbol}")
+        calibration_rows.append(f"{pred:<12.2%} {true:<12.2%} {diff:>10.2%} {symbol}")
+    print("\n".join(calibration_rows))
 
     # Feature importance
     print("\n" + "=" * 70)
@@ -131,11 +147,13 @@ def analyze_model():
         print(f"{'Rank':<6} {'Feature':<30} {'Importance':<12} {'Bar'}")
         print("-" * 70)
 
+        importance_rows = []
         for i, idx in enumerate(indices[:10]):
             importance = importances[idx]
             bar_length = int(importance * 50)
             bar = "█" * bar_length
-            print(f"{i+1:<6} {feature_names[idx]:<30} {importance:<12.4f} {bar}")
+            importance_rows.append(f"{i+1:<6} {feature_names[idx]:<30} {importance:<12.4f} {bar}")
+        print("\n".join(importance_rows))
 
         print("\n💡 Install matplotlib to generate plots: pip install matplotlib")
 
@@ -147,16 +165,20 @@ def analyze_model():
     bins = [0, 0.3, 0.4, 0.5, 0.6, 0.7, 1.0]
     labels = ["<30%", "30-40%", "40-50%", "50-60%", "60-70%", ">70%"]
 
-    pred_bins = pd.cut(y_pred_proba, bins=bins, labels=labels)
-    distribution = pred_bins.value_counts().sort_index()
+    # Count predictions per right-closed (lo, hi] bin in a single pass
+    bin_idx = np.searchsorted(bins, y_pred_proba, side="left") - 1
+    in_range = (bin_idx >= 0) & (bin_idx < len(labels))
+    counts = np.bincount(bin_idx[in_range], minlength=len(labels))
 
     print("Model confidence distribution:")
     print(f"{'Confidence':<12} {'Count':<8} {'% of Total'}")
     print("-" * 35)
-    for conf, count in distribution.items():
+    distribution_rows = []
+    for conf, count in zip(labels, counts):
         pct = count / len(y_pred_proba) * 100
         bar = "█" * int(pct / 2)
-        print(f"{conf:<12} {count:<8} {pct:>6.1f}% {bar}")
+        distribution_rows.append(f"{conf:<12} {count:<8} {pct:>6.1f}% {bar}")
+    print("\n".join(distribution_rows))
 
     # Betting performance analysis
     print("\n" + "=" * 70)
@@ -182,30 +204,44 @@ def analyze_model():
         if not odds_series.isna().all():
             home_odds = odds_series
 
+    # Sort predictions once; every threshold then reads cumulative totals at its cut-off
+    order = np.argsort(-y_pred_proba, kind="stable")
+    neg_sorted = -y_pred_proba[order]
+    cum_wins = np.cumsum(y[order])
+
+    cum_profit = cum_valid_odds = None
+    if home_odds is not None:
+        odds_sorted = home_odds.to_numpy(dtype=float)[order]
+        cum_valid_odds = np.cumsum(~np.isnan(odds_sorted))
+        odds_sorted = np.where(np.isnan(odds_sorted), 2.0, odds_sorted)
+        cum_profit = np.cumsum(np.where(y[order] == 1, odds_sorted - 1, -1))
+
+    threshold_rows = []
     for threshold in thresholds:
-        # Select bets above threshold
-        bet_mask = y_pred_proba > threshold
-        n_bets = bet_mask.sum()
+        # Number of bets strictly above threshold
+        n_bets = int(np.searchsorted(neg_sorted, -threshold, side="left"))
 
         if n_bets == 0:
             continue
 
         # Calculate results
-        actual_wins = y[bet_mask].sum()
+        actual_wins = int(cum_wins[n_bets - 1])
         win_rate = actual_wins / n_bets if n_bets > 0 else 0
 
         # Simulate profit (assuming unit stakes)
-        if home_odds is not None and not home_odds[bet_mask].isna().all():
-            odds_subset = home_odds[bet_mask].fillna(2.0)
-            profits = np.where(y[bet_mask] == 1, odds_subset - 1, -1)
-            total_profit = profits.sum()
+        if cum_profit is not None and cum_valid_odds[n_bets - 1] > 0:
+            total_profit = cum_profit[n_bets - 1]
             roi = (total_profit / n_bets) * 100
-            print(
+            threshold_rows.append(
                 f"{threshold:<12.0%} {n_bets:<8} {actual_wins:<8} {win_rate:<12.1%} "
                 f"${total_profit:+.2f} ({roi:+.1f}%)"
             )
         else:
-            print(f"{threshold:<12.0%} {n_bets:<8} {actual_wins:<8} {win_rate:<12.1%} N/A")
+            threshold_rows.append(
+                f"{threshold:<12.0%} {n_bets:<8} {actual_wins:<8} {win_rate:<12.1%} N/A"
+            )
+    if threshold_rows:
+        print("\n".join(threshold_rows))
 
     # Problem diagnosis
     print("\n" + "=" * 70)
@@ -1,18 +1,30 @@
 """Automated training, testing, and deployment pipeline."""
+import hashlib
+import inspect
 import json
-import os
+import pickle
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
     from src.backtest import Backtester
     from src.db import ModelMetadata, handle_db_errors
     from src.feature import build_features, select_features
     from src.logging_config import get_logger
-    from src.ml_pipeline import MLPipeline
+    from src.ml_pipeline import MLPipeline, save_booster
     from src.model import ModelWrapper
     from src.paths import RESULTS_DIR
     from src.tools.synthetic_data import generate_complete_dataset
@@ -25,13 +37,73 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for direct script exe
     from src.db import ModelMetadata, handle_db_errors
     from src.feature import build_features, select_features
     from src.logging_config import get_logger
-    from src.ml_pipeline import MLPipeline
+    from src.ml_pipeline import MLPipeline, save_booster
     from src.model import ModelWrapper
     from src.paths import RESULTS_DIR
     from src.tools.synthetic_data import generate_complete_dataset
 
 logger = get_logger(__name__)
 
+# Seed for the synthetic training set. Fixing it makes the data reproducible, so the
+# featurized matrix can be cached and reused between tuning and full-pipeline runs.
+SYNTHETIC_SEED = 42
+# Days of synthetic data generated and featurized per chunk
+TRAINING_CHUNK_DAYS = 7
+HOLDOUT_DAYS = 30
+TRAINING_CACHE_DIR = RESULTS_DIR / ".cache"
+
+
+@lru_cache(maxsize=1)
+def _training_code_fingerprint() -> str:
+    """Hash the source files that determine the cached training matrix.
+
+    Covers feature engineering (build_features/select_features), the synthetic
+    data generator and this script's featurization, so editing any of them
+    changes the cache key without a manual version bump.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for source in (
+        inspect.getsourcefile(build_features),
+        inspect.getsourcefile(generate_complete_dataset),
+        __file__,
+    ):
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+
+def _binary_metrics(y_true, proba, eps: float = 1e-15):
+    """Return (accuracy, Brier score, log loss) for binary labels in one pass.
+
+    The three metrics share the same label/probability arrays, so they are
+    computed from common intermediates instead of three separate sklearn calls.
+    """
+    y = np.asarray(y_true, dtype=np.float64)
+    p = np.asarray(proba, dtype=np.float64)
+    is_pos = y == 1.0
+
+    diff = p - y
+    brier = float(np.mean(diff * diff))
+    accuracy = float(np.mean((p > 0.5) == is_pos))
+    p_clipped = np.clip(p, eps, 1 - eps)
+    logloss = float(-np.mean(np.where(is_pos, np.log(p_clipped), np.log1p(-p_clipped))))
+    return accuracy, brier, logloss
+
+
+def _top_k_importances(importances, feature_names, k: int = 5) -> dict:
+    """Return the k most important features as an ordered {name: importance} dict.
+
+    Uses argpartition to pick the top k, then sorts only those k.
+    """
+    importances = np.asarray(importances, dtype=float)
+    k = min(k, importances.size)
+    if k == 0:
+        return {}
+
+    top_idx = np.argpartition(-importances, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-importances[top_idx], kind="stable")]
+    names = np.asarray(feature_names)[top_idx]
+    return dict(zip(names.tolist(), importances[top_idx].tolist()))
+
 
 class AutomatedPipeline:
     """Automated ML pipeline for continuous improvement."""
@@ -39,43 +111,174 @@ class AutomatedPipeline:
     def __init__(self):
         """Initialize automated pipeline."""
         self.results = {}
-        self.output_dir = RESULTS_DIR
-        os.makedirs(self.output_dir, exist_ok=True)
-
-    def _prepare_training_data(self, n_days: int):
-        """Generate synthetic data and build training features."""
-        train_fixtures, train_odds, train_results = generate_complete_dataset(
-            n_days=n_days, games_per_day=10
-        )
-
-        train_features = build_features(train_fixtures, train_odds)
-        train_features = train_features.merge(train_results, on="market_id", how="left")
-        train_features["label"] = (train_features["result"] == "home").astype(int)
-        train_features_clean = train_features.dropna(subset=["label"])
+        self.output_dir = Path(RESULTS_DIR)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def _featurize(self, fixtures, odds, results):
+        """Build model inputs and home-win labels for one synthetic dataset.
+
+        Returns:
+            Tuple of (X_numeric, y) restricted to markets with a result
+        """
+        features = build_features(fixtures, odds)
+        # Attach results by market position (one hash pass over the IDs) instead of an
+        # object-dtype merge; result stays a categorical, so == "home" compares codes
+        result_pos = pd.Index(results["market_id"]).get_indexer(features["market_id"])
+        features["result"] = results["result"].array.take(result_pos, allow_fill=True)
+        features = features.dropna(subset=["result"])
 
         # CRITICAL FIX: Use select_features to match live tracker
-        X_train_numeric = select_features(train_features_clean.drop(
-            columns=["label", "market_id", "result"], errors="ignore"
-        ))
-        y_train = train_features_clean["label"].values
+        X_numeric = select_features(features.drop(columns=["market_id", "result"], errors="ignore"))
+        y = (features["result"] == "home").to_numpy(dtype=np.int8)
+        return X_numeric, y
+
+    def _iter_training_chunks(
+        self,
+        n_days: int,
+        games_per_day: int = 10,
+        chunk_days: int = TRAINING_CHUNK_DAYS,
+        seed: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+    ):
+        """Yield synthetic (fixtures, odds, results) for consecutive chunk_days windows.
+
+        When ``seed`` is given, the RNG is reseeded per chunk index so the
+        generated dataset is reproducible chunk by chunk. ``start_date``
+        defaults to ``n_days`` before now.
+        """
+        if start_date is None:
+            start_date = datetime.now(timezone.utc) - timedelta(days=n_days)
+        for chunk_idx, day in enumerate(range(0, n_days, chunk_days)):
+            if seed is not None:
+                np.random.seed(seed + chunk_idx)
+            yield generate_complete_dataset(
+                n_days=min(chunk_days, n_days - day),
+                games_per_day=games_per_day,
+                start_date=start_date + timedelta(days=day),
+            )
 
-        return train_fixtures, train_odds, train_results, X_train_numeric, y_train
+    def _generate_holdout(self, seed: Optional[int] = None, games_per_day: int = 10):
+        """Generate the HOLDOUT_DAYS hold-out dataset as one chunk.
+
+        Kept as a single chunk so its market IDs are unique for the backtest.
+        """
+        if seed is not None:
+            np.random.seed(seed)
+        return generate_complete_dataset(n_days=HOLDOUT_DAYS, games_per_day=games_per_day)
+
+    def _prepare_training_data(
+        self, n_days: int, games_per_day: int = 10, seed: int = SYNTHETIC_SEED
+    ):
+        """Load the featurized synthetic training set from cache, or build and cache it.
+
+        Returns:
+            Tuple of (n_matches, X_train_numeric, y_train)
+        """
+        # Fixture dates (and so day_of_week/is_weekend/hour_of_day) follow the start
+        # date, so it is pinned to a midnight and made part of the key: a cache hit
+        # then holds the same dates a fresh run with that key would generate
+        start_date = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=n_days)
+        key = hashlib.blake2b(
+            f"{_training_code_fingerprint()}|{n_days}|{games_per_day}|{seed}|"
+            f"{start_date.date().isoformat()}".encode(),
+            digest_size=8,
+        ).hexdigest()
+        cache_path = TRAINING_CACHE_DIR / f"train_{key}.npz"
+
+        if cache_path.exists():
+            with np.load(cache_path) as data:
+                X_train_numeric = pd.DataFrame(data["X"], columns=list(data["columns"]))
+                logger.info(f"Loaded cached training data from {cache_path}")
+                return int(data["n_matches"]), X_train_numeric, data["y"]
+
+        n_matches, X_train_numeric, y_train = self._build_training_data(
+            n_days, games_per_day, seed, start_date=start_date
+        )
 
-    def run_tuning_only(self, n_days: int = 180, n_trials: int = 20, n_splits: int = 5):
-        """Run hyperparameter tuning only, persisting Optuna study."""
+        TRAINING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            cache_path,
+            X=X_train_numeric.to_numpy(dtype=np.float32),
+            y=y_train,
+            columns=np.asarray(X_train_numeric.columns, dtype=str),
+            n_matches=n_matches,
+        )
+        return n_matches, X_train_numeric, y_train
+
+    def _build_training_data(
+        self,
+        n_days: int,
+        games_per_day: int = 10,
+        seed: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+    ):
+        """Generate synthetic data and build training features chunk by chunk.
+
+        Each chunk is featurized and copied into preallocated float32/int8
+        buffers before the next one is generated, so the full fixture, odds and
+        feature frames are never held in memory at once.
+
+        Returns:
+            Tuple of (n_matches, X_train_numeric, y_train)
+        """
+        # Daily game counts are drawn around games_per_day; leave headroom so the
+        # buffers rarely need to grow
+        capacity = max(1, n_days * games_per_day * 3 // 2)
+        X_buf = None
+        y_buf = np.empty(capacity, dtype=np.int8)
+        columns = None
+        n_matches = 0
+        offset = 0
+
+        for fixtures, odds, results in self._iter_training_chunks(
+            n_days, games_per_day, seed=seed, start_date=start_date
+        ):
+            n_matches += len(fixtures)
+            chunk_X, chunk_y = self._featurize(fixtures, odds, results)
+            if columns is None:
+                columns = chunk_X.columns
+                X_buf = np.empty((capacity, len(columns)), dtype=np.float32)
+            else:
+                chunk_X = chunk_X.reindex(columns=columns, fill_value=0)
+
+            n_rows = len(chunk_X)
+            if offset + n_rows > capacity:
+                capacity = max(2 * capacity, offset + n_rows)
+                grown_X = np.empty((capacity, len(columns)), dtype=np.float32)
+                grown_X[:offset] = X_buf[:offset]
+                grown_y = np.empty(capacity, dtype=np.int8)
+                grown_y[:offset] = y_buf[:offset]
+                X_buf, y_buf = grown_X, grown_y
+
+            X_buf[offset : offset + n_rows] = chunk_X.to_numpy(dtype=np.float32)
+            y_buf[offset : offset + n_rows] = chunk_y
+            offset += n_rows
+            del fixtures, odds, results, chunk_X, chunk_y
+
+        if X_buf is None:
+            return n_matches, pd.DataFrame(), y_buf[:0]
+
+        X_train_numeric = pd.DataFrame(X_buf[:offset], columns=columns, copy=False)
+        return n_matches, X_train_numeric, y_buf[:offset]
+
+    def run_tuning_only(
+        self, n_days: int = 180, n_trials: int = 20, n_splits: int = 5, n_jobs: int = -1
+    ):
+        """Run hyperparameter tuning only, persisting Optuna study.
+
+        Trials run concurrently across ``n_jobs`` threads. Several ``--tune-only``
+        processes can also be launched side by side; they share the study stored
+        in data/optuna.db.
+        """
         print("\n" + "=" * 70)
         print("  OPTUNA TUNING ONLY")
         print("=" * 70 + "\n")
 
         print("📊 STEP 1: Generating training data...")
-        (
-            train_fixtures,
-            train_odds,
-            train_results,
-            X_train_numeric,
-            y_train,
-        ) = self._prepare_training_data(n_days)
-        print(f"   ✅ Generated {len(train_fixtures)} training matches")
+        n_train_matches, X_train_numeric, y_train = self._prepare_training_data(n_days)
+        print(f"   ✅ Generated {n_train_matches} training matches")
         print(f"   ✅ Numerical feature shape: {X_train_numeric.shape}\n")
 
         print("🤖 STEP 2: Running hyperparameter optimization...")
@@ -85,6 +288,7 @@ class AutomatedPipeline:
             y_train,
             n_splits=n_splits,
             n_trials=n_trials,
+            n_jobs=n_jobs,
         )
 
         self.results["training"] = {
@@ -107,7 +311,7 @@ class AutomatedPipeline:
 
         return pipeline
 
-    def run_full_pipeline(self, advanced=True, n_days=180):
+    def run_full_pipeline(self, advanced=True, n_days=180, n_jobs=-1):
         """Run complete pipeline: train -> validate -> backtest -> save."""
         print("\n" + "=" * 70)
         print("  AUTOMATED ML PIPELINE")
@@ -115,14 +319,8 @@ class AutomatedPipeline:
 
         # Step 1: Generate data
         print("📊 STEP 1: Generating training data...")
-        (
-            train_fixtures,
-            train_odds,
-            train_results,
-            X_train_numeric,
-            y_train,
-        ) = self._prepare_training_data(n_days)
-        print(f"   ✅ Generated {len(train_fixtures)} training matches\n")
+        n_train_matches, X_train_numeric, y_train = self._prepare_training_data(n_days)
+        print(f"   ✅ Generated {n_train_matches} training matches\n")
 
         # Step 2: Feature summary
         print("🔧 STEP 2: Feature engineering...")
@@ -135,14 +333,18 @@ class AutomatedPipeline:
             print("   Using advanced pipeline with hyperparameter optimization...")
             pipeline = MLPipeline()
             pipeline.train_with_cv(
-                X_train_numeric, y_train, n_splits=5, n_trials=10  # Reduced for speed
+                X_train_numeric,
+                y_train,
+                n_splits=5,
+                n_trials=10,  # Reduced for speed
+                n_jobs=n_jobs,
             )
             model = pipeline.model
             print("   ✅ Advanced model trained with hyperparameter tuning")
         else:
             print("   Using standard model...")
             model = ModelWrapper()
-            model.train(X_train_numeric.values, y_train)
+            model.train(X_train_numeric, y_train)
             print("   ✅ Model trained")
 
         self.results["training"] = {
@@ -154,35 +356,27 @@ class AutomatedPipeline:
 
         # Step 4: Validation
         print("✅ STEP 4: Validation on hold-out set...")
-        test_fixtures, test_odds, test_results = generate_complete_dataset(
-            n_days=30, games_per_day=10
+        # Draw the hold-out from the same seeded stream, continuing after the last
+        # training chunk, so re-runs reproduce it and it never repeats training draws
+        n_train_chunks = -(-n_days // TRAINING_CHUNK_DAYS)
+        test_fixtures, test_odds, test_results = self._generate_holdout(
+            seed=SYNTHETIC_SEED + n_train_chunks
         )
 
-        test_features = build_features(test_fixtures, test_odds)
-        test_features = test_features.merge(test_results, on="market_id", how="left")
-        test_features["label"] = (test_features["result"] == "home").astype(int)
-        test_features_clean = test_features.dropna(subset=["label"])
-
-        # CRITICAL FIX: Use select_features to match live tracker
-        X_test_numeric = select_features(test_features_clean.drop(
-            columns=["label", "market_id", "result"], errors="ignore"
-        ))
-        y_test = test_features_clean["label"].values
-
-        # Handle both ModelWrapper and raw LightGBM Booster
-        if hasattr(model, "predict_proba"):
-            y_pred_proba = model.predict_proba(X_test_numeric.values)[:, 1]
-        else:
-            # Raw LightGBM Booster from MLPipeline
-            y_pred_proba = model.predict(X_test_numeric.values)
+        X_test_numeric, y_test = self._featurize(test_fixtures, test_odds, test_results)
+        X_test_numeric = X_test_numeric.reindex(columns=X_train_numeric.columns, fill_value=0)
 
-        y_pred = (y_pred_proba > 0.5).astype(int)
+        # Convert the hold-out once to the float32 matrix both model types consume
+        X_test_input = np.ascontiguousarray(X_test_numeric.to_numpy(dtype=np.float32))
 
-        from sklearn.metrics import accuracy_score, brier_score_loss, log_loss
+        # Handle both ModelWrapper and raw LightGBM Booster; both yield 1-D P(home win)
+        if hasattr(model, "predict_pos_proba"):
+            y_pred_proba = model.predict_pos_proba(X_test_input)
+        else:
+            # Raw binary LightGBM Booster from MLPipeline
+            y_pred_proba = model.predict(X_test_input)
 
-        accuracy = accuracy_score(y_test, y_pred)
-        brier = brier_score_loss(y_test, y_pred_proba)
-        logloss = log_loss(y_test, y_pred_proba)
+        accuracy, brier, logloss = _binary_metrics(y_test, y_pred_proba)
 
         print(f"   📊 Accuracy: {accuracy:.2%}")
         print(f"   📊 Brier Score: {brier:.4f}")
@@ -222,32 +416,17 @@ class AutomatedPipeline:
         if hasattr(actual_model, "feature_importance"):
             # LightGBM Booster
             importances = actual_model.feature_importance(importance_type="gain")
-            feature_names = X_train_numeric.columns
-
-            top_features = {}
-            indices = np.argsort(importances)[::-1][:5]
-
-            print("   Top 5 features:")
-            for i, idx in enumerate(indices):
-                feat_name = feature_names[idx]
-                feat_imp = importances[idx]
-                top_features[feat_name] = float(feat_imp)
-                print(f"     {i+1}. {feat_name}: {feat_imp:.4f}")
-
-            self.results["feature_importance"] = top_features
         elif hasattr(actual_model, "feature_importances_"):
             # Sklearn-style model
             importances = actual_model.feature_importances_
-            feature_names = X_train_numeric.columns
+        else:
+            importances = None
 
-            top_features = {}
-            indices = np.argsort(importances)[::-1][:5]
+        if importances is not None:
+            top_features = _top_k_importances(importances, X_train_numeric.columns, k=5)
 
             print("   Top 5 features:")
-            for i, idx in enumerate(indices):
-                feat_name = feature_names[idx]
-                feat_imp = importances[idx]
-                top_features[feat_name] = float(feat_imp)
+            for i, (feat_name, feat_imp) in enumerate(top_features.items()):
                 print(f"     {i+1}. {feat_name}: {feat_imp:.4f}")
 
             self.results["feature_importance"] = top_features
@@ -260,19 +439,17 @@ class AutomatedPipeline:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Save model (handle both types)
-        model_path = f"{self.output_dir}/model_{timestamp}.pkl"
         if hasattr(model, "save"):
             # ModelWrapper
+            model_path = self.output_dir / f"model_{timestamp}.pkl"
             model.save(model_path)
         else:
-            # Raw LightGBM Booster
-            import pickle
-
-            with open(model_path, "wb") as f:
-                pickle.dump(model, f)
+            # Raw LightGBM Booster: native text format instead of pickle
+            model_path = save_booster(model, self.output_dir / f"model_{timestamp}")
         print(f"   ✅ Model saved: {model_path}")
 
-        # Update main model file for live tracker
+        # Update main model file for live tracker. It stays a pickle at models/model.pkl
+        # because live_tracker loads (and watches) exactly that file via ModelWrapper.load
         main_model_path = self.output_dir.parent / "model.pkl"
         if hasattr(model, "save"):
             model.save(main_model_path)
@@ -283,8 +460,20 @@ class AutomatedPipeline:
 
         # Save results JSON
         results_path = self.output_dir / f"results_{timestamp}.json"
-        with open(results_path, "w") as f:
-            json.dump(self.results, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            # Serializes numpy scalars natively; str() only for anything else unknown
+            results_path.write_bytes(
+                orjson.dumps(
+                    self.results,
+                    default=str,
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        else:
+            with open(results_path, "w") as f:
+                json.dump(self.results, f, indent=2, default=str)
         print(f"   ✅ Results saved: {results_path}")
 
         # Save to database
@@ -362,15 +551,20 @@ def main():
     parser.add_argument(
         "--trials", type=int, default=20, help="Number of Optuna trials for tuning-only mode"
     )
+    parser.add_argument(
+        "--jobs", type=int, default=-1, help="Concurrent Optuna trials (-1 uses all cores)"
+    )
     args = parser.parse_args()
 
     pipeline = AutomatedPipeline()
 
     if args.tune_only:
-        pipeline.run_tuning_only(n_days=args.days, n_trials=args.trials)
+        pipeline.run_tuning_only(n_days=args.days, n_trials=args.trials, n_jobs=args.jobs)
         return 0
 
-    results = pipeline.run_full_pipeline(advanced=args.advanced, n_days=args.days)
+    results = pipeline.run_full_pipeline(
+        advanced=args.advanced, n_days=args.days, n_jobs=args.jobs
+    )
 
     return 0 if results["validation"]["accuracy"] > 0.50 else 1
 
@@ -2,6 +2,7 @@
 """Automated model retraining orchestrator."""
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -17,12 +18,36 @@ from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_sc
 from src.model_version import ModelVersionManager
 from src.data_collector import DataCollector
 from src.model_ensemble import EnsembleModel
+from src.ml_pipeline import OPTUNA_STORAGE_URL, OPTUNA_STUDY_NAME
 from src.feature import build_features
 from src.logging_config import get_logger
 from src.alerts import send_alert
 
 logger = get_logger(__name__)
 
+# Tree hyperparameters tuned by the pipeline's Optuna study that also apply to the
+# ensemble's (multiclass) LightGBM member
+TRANSFERABLE_LGB_PARAMS = (
+    'learning_rate', 'num_leaves', 'min_data_in_leaf', 'feature_fraction',
+    'bagging_fraction', 'bagging_freq', 'lambda_l1', 'lambda_l2',
+)
+
+
+def load_tuned_lgb_params():
+    """Return the best LightGBM tree parameters from the persisted Optuna study.
+
+    Returns None when no study or no completed trial exists yet.
+    """
+    try:
+        import optuna
+
+        study = optuna.load_study(study_name=OPTUNA_STUDY_NAME, storage=OPTUNA_STORAGE_URL)
+        best_params = study.best_params
+    except Exception as e:
+        logger.info(f"No tuned LightGBM parameters available: {e}")
+        return None
+    return {k: v for k, v in best_params.items() if k in TRANSFERABLE_LGB_PARAMS}
+
 
 def main():
     """Run automated retraining."""
@@ -31,13 +56,21 @@ def main():
     print("=" * 70)
     print()
     
+    # Alerts go out on a background thread so training and teardown never wait on
+    # the Telegram round trip. A single worker keeps them in order, and the pool is
+    # drained before main() returns.
+    io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="retrain-alerts")
+    alerts = []
+    
     try:
         # Initialize components
         version_manager = ModelVersionManager()
         data_collector = DataCollector()
         
         # Send start notification
-        send_alert("🤖 Automated retraining started...", level="info")
+        alerts.append(
+            io_pool.submit(send_alert, "🤖 Automated retraining started...", level="info")
+        )
         
         # Step 1: Collect new data
         print("📊 Step 1: Collecting recent match results...")
@@ -46,7 +79,7 @@ def main():
         if len(new_results) < 50:
             msg = f"⚠️ Insufficient new data ({len(new_results)} samples). Skipping retraining."
             logger.warning(msg)
-            send_alert(msg, level="warning")
+            alerts.append(io_pool.submit(send_alert, msg, level="warning"))
             return
         
         # Step 2: Validate data
@@ -54,7 +87,7 @@ def main():
         if not data_collector.validate_results(new_results):
             msg = "❌ Data validation failed. Aborting retraining."
             logger.error(msg)
-            send_alert(msg, level="error")
+            alerts.append(io_pool.submit(send_alert, msg, level="error"))
             return
         
         # Step 3: Prepare features
@@ -63,16 +96,15 @@ def main():
         # Create fixtures DataFrame from results
         fixtures = new_results[['market_id', 'home', 'away']].copy()
         
-        # Create odds DataFrame
-        odds_data = []
-        for _, row in new_results.iterrows():
-            for selection, odds_col in [('home', 'home_odds'), ('away', 'away_odds'), ('draw', 'draw_odds')]:
-                odds_data.append({
-                    'market_id': row['market_id'],
-                    'selection': selection,
-                    'odds': row[odds_col]
-                })
-        odds = pd.DataFrame(odds_data)
+        # Create odds DataFrame (one long-form row per market/selection) from typed
+        # arrays: row-major ravel of the odds block lines up with repeat/tile below
+        odds = pd.DataFrame({
+            'market_id': np.repeat(new_results['market_id'].to_numpy(), 3),
+            'selection': pd.Categorical(np.tile(['home', 'away', 'draw'], len(new_results))),
+            'odds': new_results[['home_odds', 'away_odds', 'draw_odds']]
+            .to_numpy(dtype=np.float64)
+            .ravel(),
+        })
         
         # Build features
         features_df = build_features(fixtures, odds)
@@ -93,7 +125,7 @@ def main():
         print("📚 Step 4: Preparing training data...")
         
         feature_cols = [col for col in features_df.columns if col not in ['market_id', 'outcome', 'home', 'away', 'start', 'sport', 'league']]
-        X = features_df[feature_cols].select_dtypes(include=[np.number]).fillna(0).values
+        X = features_df[feature_cols].select_dtypes(include=[np.number]).fillna(0).to_numpy(dtype=np.float32)
         
         # Encode labels
         label_encoder = LabelEncoder()
@@ -108,13 +140,20 @@ def main():
         # Step 6: Train new model
         print("🤖 Step 6: Training new ensemble model...")
         
+        # Hold out the evaluation set before training so Step 7 scores unseen matches
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        
         new_model = EnsembleModel()
-        new_model.train(X, y, verbose=False)
+        # Start from the tuned parameters of the shared Optuna study instead of defaults
+        tuned_params = load_tuned_lgb_params()
+        if tuned_params:
+            new_model.lgb_params.update(tuned_params)
+            print(f"   Using tuned LightGBM parameters: {tuned_params}")
+        new_model.train(X_train, y_train, verbose=False)
         
         # Step 7: Evaluate performance
         print("📈 Step 7: Evaluating model performance...")
         
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         y_pred = new_model.predict(X_test)
         
         accuracy = accuracy_score(y_test, y_pred)
@@ -143,7 +182,7 @@ def main():
             if improvement < 0.01:
                 msg = f"⚠️ New model accuracy ({accuracy:.4f}) not significantly better. Keeping current model."
                 logger.info(msg)
-                send_alert(msg, level="info")
+                alerts.append(io_pool.submit(send_alert, msg, level="info"))
                 return
         
         # Step 9: Deploy new model
@@ -152,17 +191,17 @@ def main():
         new_model.save()
         
         # Save metrics in version history
-        current_version_id = version_manager.get_latest_version()['version_id']
-        for version in version_manager.versions:
-            if version['version_id'] == current_version_id:
-                version['metrics'] = {
-                    'accuracy': float(accuracy),
-                    'precision': float(precision),
-                    'recall': float(recall),
-                    'f1': float(f1)
-                }
-                break
-        version_manager._save_versions()
+        current_version = version_manager.get_latest_version()
+        if current_version is not None:
+            current_version['metrics'] = {
+                'accuracy': float(accuracy),
+                'precision': float(precision),
+                'recall': float(recall),
+                'f1': float(f1)
+            }
+            version_manager._save_versions()
+        else:
+            logger.warning("No model version recorded; skipping metrics update")
         
         # Step 10: Cleanup old backups
         print("🧹 Step 10: Cleaning up old backups...")
@@ -184,12 +223,21 @@ def main():
             f"📦 Training data: {len(features_df)} matches\n"
             f"🚀 New model deployed"
         )
-        send_alert(msg, level="info")
+        alerts.append(io_pool.submit(send_alert, msg, level="info"))
         
     except Exception as e:
         logger.error(f"Retraining failed: {e}", exc_info=True)
-        send_alert(f"❌ Model retraining failed: {str(e)}", level="error")
+        alerts.append(
+            io_pool.submit(send_alert, f"❌ Model retraining failed: {str(e)}", level="error")
+        )
         raise
+    finally:
+        for alert in alerts:
+            try:
+                alert.result()
+            except Exception:
+                logger.exception("Failed to send retraining alert")
+        io_pool.shutdown(wait=True)
 
 
 if __name__ == "__main__":
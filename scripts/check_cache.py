@@ -20,33 +20,14 @@ def main():
     print("  CACHE STATISTICS")
     print("=" * 70 + "\n")
 
-    print(f"📊 Fixtures cached: {stats['fixtures_count']}")
-    if stats["fixtures_oldest"]:
-        oldest = stats["fixtures_oldest"]
-        if oldest.tzinfo is None:
-            oldest = oldest.replace(tzinfo=timezone.utc)
-        age = datetime.now(timezone.utc) - oldest
-        print(f"   Oldest: {stats['fixtures_oldest']} (age: {age})")
-    if stats["fixtures_newest"]:
-        newest = stats["fixtures_newest"]
-        if newest.tzinfo is None:
-            newest = newest.replace(tzinfo=timezone.utc)
-        age = datetime.now(timezone.utc) - newest
-        print(f"   Newest: {stats['fixtures_newest']} (age: {age})")
-
-    print(f"\n📊 Odds cached: {stats['odds_count']}")
-    if stats["odds_oldest"]:
-        oldest = stats["odds_oldest"]
-        if oldest.tzinfo is None:
-            oldest = oldest.replace(tzinfo=timezone.utc)
-        age = datetime.now(timezone.utc) - oldest
-        print(f"   Oldest: {stats['odds_oldest']} (age: {age})")
-    if stats["odds_newest"]:
-        newest = stats["odds_newest"]
-        if newest.tzinfo is None:
-            newest = newest.replace(tzinfo=timezone.utc)
-        age = datetime.now(timezone.utc) - newest
-        print(f"   Newest: {stats['odds_newest']} (age: {age})")
+    # Timestamps come back timezone-aware, so one "now" serves every age
+    now_utc = datetime.now(timezone.utc)
+
+    for label, prefix in (("📊 Fixtures cached", "fixtures"), ("\n📊 Odds cached", "odds")):
+        print(f"{label}: {stats[f'{prefix}_count']}")
+        for name, key in (("Oldest", f"{prefix}_oldest"), ("Newest", f"{prefix}_newest")):
+            if stats[key]:
+                print(f"   {name}: {stats[key]} (age: {now_utc - stats[key]})")
 
     print("\n" + "=" * 70)
     print("\n💡 Cache TTL Settings:")
@@ -1,9 +1,21 @@
 """Simple monitoring dashboard for betting system."""
+import io
 import json
 import os
 import sys
+import time
+from contextlib import redirect_stdout
 from datetime import datetime
 
+from sqlalchemy import case, func
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from src.cache import CachedFixture, CachedOdds
     from src.db import BetRecord, ModelMetadata, handle_db_errors
@@ -20,33 +32,55 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for direct execution
 
 logger = get_logger(__name__)
 
+# Seconds a database-backed stats result is reused across repeated renders
+STATS_TTL_SECONDS = 30.0
+
 
 class Dashboard:
     """Simple text-based monitoring dashboard."""
 
-    def __init__(self):
-        """Initialize dashboard."""
+    def __init__(self, stats_ttl: float = STATS_TTL_SECONDS):
+        """Initialize dashboard.
+
+        Args:
+            stats_ttl: Seconds to reuse database query results between renders
+        """
         self.paper_trading_file = PAPER_TRADING_FILE
+        self.stats_ttl = stats_ttl
+        self._stats_cache = {}
+
+    def _cached(self, key, loader):
+        """Return loader() memoized under key for stats_ttl seconds."""
+        now = time.monotonic()
+        entry = self._stats_cache.get(key)
+        if entry is not None and now - entry[0] < self.stats_ttl:
+            return entry[1]
+
+        value = loader()
+        self._stats_cache[key] = (now, value)
+        return value
+
+    def clear_stats_cache(self):
+        """Drop memoized query results so the next render hits the database."""
+        self._stats_cache.clear()
 
     def get_cache_stats(self):
         """Get cache statistics."""
+        return self._cached("cache_stats", self._query_cache_stats)
+
+    def _query_cache_stats(self):
         with handle_db_errors() as session:
-            fixtures_count = session.query(CachedFixture).count()
-            odds_count = session.query(CachedOdds).count()
+            # Count and age range in one aggregate query instead of a count plus two ordered scans
+            fixtures_count, oldest_fetched, newest_fetched = session.query(
+                func.count(CachedFixture.id),
+                func.min(CachedFixture.fetched_at),
+                func.max(CachedFixture.fetched_at),
+            ).one()
+            odds_count = session.query(func.count(CachedOdds.id)).scalar()
 
             # Get age info
             if fixtures_count > 0:
-                oldest_fixture = (
-                    session.query(CachedFixture).order_by(CachedFixture.fetched_at.asc()).first()
-                )
-                newest_fixture = (
-                    session.query(CachedFixture).order_by(CachedFixture.fetched_at.desc()).first()
-                )
-
-                fixture_age = {
-                    "oldest": oldest_fixture.fetched_at if oldest_fixture else None,
-                    "newest": newest_fixture.fetched_at if newest_fixture else None,
-                }
+                fixture_age = {"oldest": oldest_fetched, "newest": newest_fetched}
             else:
                 fixture_age = None
 
@@ -54,28 +88,32 @@ class Dashboard:
 
     def get_betting_stats(self):
         """Get betting statistics from database."""
+        return self._cached("betting_stats", self._query_betting_stats)
+
+    def _query_betting_stats(self):
         with handle_db_errors() as session:
-            total_bets = session.query(BetRecord).count()
+            # Aggregate in the database so no BetRecord rows are loaded
+            is_settled = BetRecord.result.isnot(None)
+            total_bets, settled, wins, losses, total_staked, total_profit = session.query(
+                func.count(BetRecord.id),
+                func.coalesce(func.sum(case((is_settled, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((BetRecord.result == "win", 1), else_=0)), 0),
+                func.coalesce(func.sum(case((BetRecord.result == "loss", 1), else_=0)), 0),
+                # SUM skips NULLs, so unsettled rows and missing profit_loss add nothing
+                func.coalesce(func.sum(case((is_settled, BetRecord.stake))), 0.0),
+                func.coalesce(func.sum(case((is_settled, BetRecord.profit_loss))), 0.0),
+            ).one()
 
             if total_bets == 0:
                 return None
 
-            # Get settled bets
-            settled = session.query(BetRecord).filter(BetRecord.result.isnot(None)).all()
-
-            wins = [b for b in settled if b.result == "win"]
-            losses = [b for b in settled if b.result == "loss"]
-
-            total_staked = sum(b.stake for b in settled)
-            total_profit = sum(b.profit_loss or 0 for b in settled)
-
             return {
                 "total": total_bets,
-                "settled": len(settled),
-                "pending": total_bets - len(settled),
-                "wins": len(wins),
-                "losses": len(losses),
-                "win_rate": len(wins) / len(settled) if settled else 0,
+                "settled": settled,
+                "pending": total_bets - settled,
+                "wins": wins,
+                "losses": losses,
+                "win_rate": wins / settled if settled else 0,
                 "total_staked": total_staked,
                 "total_profit": total_profit,
                 "roi": (total_profit / total_staked * 100) if total_staked > 0 else 0,
@@ -83,31 +121,48 @@ class Dashboard:
 
     def get_paper_trading_stats(self):
         """Get paper trading statistics."""
-        if not self.paper_trading_file.exists():
+        # One stat covers both a missing file and an empty one ("" or "[]"),
+        # so neither is opened or decoded
+        try:
+            if self.paper_trading_file.stat().st_size < 3:
+                return None
+        except FileNotFoundError:
             return None
 
         try:
-            with open(self.paper_trading_file, "r") as f:
-                bets = json.load(f)
+            if ORJSON_AVAILABLE:
+                bets = orjson.loads(self.paper_trading_file.read_bytes())
+            else:
+                with open(self.paper_trading_file, "r") as f:
+                    bets = json.load(f)
 
             if not bets:
                 return None
 
-            settled = [b for b in bets if b["status"] == "settled"]
-            pending = [b for b in bets if b["status"] == "pending"]
-            wins = [b for b in settled if b.get("result") == "win"]
-            losses = [b for b in settled if b.get("result") == "loss"]
-
-            total_staked = sum(b["stake"] for b in settled)
-            total_profit = sum(b.get("profit", 0) for b in settled)
+            # Single pass with scalar counters instead of building filtered lists
+            settled = pending = wins = losses = 0
+            total_staked = total_profit = 0
+            for b in bets:
+                status = b["status"]
+                if status == "pending":
+                    pending += 1
+                elif status == "settled":
+                    settled += 1
+                    total_staked += b["stake"]
+                    total_profit += b.get("profit", 0)
+                    result = b.get("result")
+                    if result == "win":
+                        wins += 1
+                    elif result == "loss":
+                        losses += 1
 
             return {
                 "total": len(bets),
-                "settled": len(settled),
-                "pending": len(pending),
-                "wins": len(wins),
-                "losses": len(losses),
-                "win_rate": len(wins) / len(settled) if settled else 0,
+                "settled": settled,
+                "pending": pending,
+                "wins": wins,
+                "losses": losses,
+                "win_rate": wins / settled if settled else 0,
                 "total_staked": total_staked,
                 "total_profit": total_profit,
                 "roi": (total_profit / total_staked * 100) if total_staked > 0 else 0,
@@ -118,6 +173,9 @@ class Dashboard:
 
     def get_model_info(self):
         """Get latest model information."""
+        return self._cached("model_info", self._query_model_info)
+
+    def _query_model_info(self):
         with handle_db_errors() as session:
             latest_model = (
                 session.query(ModelMetadata).order_by(ModelMetadata.trained_at.desc()).first()
@@ -135,6 +193,15 @@ class Dashboard:
 
     def display(self):
         """Display dashboard."""
+        # Render into memory and emit with a single write instead of ~40 print calls
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            self._render()
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+    def _render(self):
+        """Print every dashboard section to stdout."""
         print("\n" + "=" * 80)
         print("  📊 BETTING SYSTEM DASHBOARD")
         print("=" * 80)
@@ -1,17 +1,27 @@
 #!/usr/bin/env python3
 """Generate 5+ daily betting opportunities automatically."""
+import asyncio
 import sys
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
-import requests
+from operator import itemgetter
+import aiohttp
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Load environment variables
-load_dotenv(project_root / '.env')
+# Load environment variables only when run as a script; importers (e.g.
+# scripts/test_bias.py) don't pay for or get side effects from the .env read
+if __name__ == "__main__":
+    load_dotenv(project_root / '.env')
 
 from src.logging_config import get_logger
 from src.social.ml_predictor import get_predictor
@@ -35,7 +45,6 @@ LEAGUES = [
 
 from src.config import settings
 
-API_KEY = os.getenv('THEODDS_API_KEY')
 BASE_URL = 'https://api.the-odds-api.com/v4'
 
 def get_mock_fixtures():
@@ -88,6 +97,62 @@ def get_mock_fixtures():
     return mock_data
 
 
+def _get_api_key():
+    """Return the Odds API key, read from the environment at call time."""
+    return os.getenv('THEODDS_API_KEY')
+
+
+async def _fetch_league_fixtures(session, league, api_key):
+    """Fetch odds fixtures for one league; returns an empty list on failure."""
+    params = {
+        'regions': 'uk,eu,us',
+        'markets': 'h2h,totals', # Added totals for better mock parity
+        'oddsFormat': 'decimal'
+    }
+    if api_key:
+        params['apiKey'] = api_key
+    
+    try:
+        async with session.get(
+            f'{BASE_URL}/sports/{league}/odds',
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status == 200:
+                if ORJSON_AVAILABLE:
+                    # Parse the raw body directly, skipping the str decode and stdlib parser
+                    fixtures = orjson.loads(await response.read())
+                else:
+                    fixtures = await response.json()
+                for fixture in fixtures:
+                    fixture['league'] = league
+                logger.info(f"✓ {league}: {len(fixtures)} fixtures")
+                return fixtures
+            elif response.status == 401:
+                logger.error(
+                    f"⛔ {league}: 401 Unauthorized - Check API Key/Quota. "
+                    f"{await response.text()}"
+                )
+            else:
+                logger.warning(f"✗ {league}: {response.status} - {await response.text()}")
+            
+    except Exception as e:
+        logger.error(f"Error fetching {league}: {e}")
+    
+    return []
+
+
+async def _fetch_all_leagues(api_key):
+    """Fetch every league concurrently on one event loop, in LEAGUES order."""
+    # One connector for all leagues so DNS lookups and connections are reused
+    connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            *(_fetch_league_fixtures(session, league, api_key) for league in LEAGUES)
+        )
+    return [fixture for fixtures in results for fixture in fixtures]
+
+
 def fetch_all_fixtures():
     """Fetch fixtures from all leagues."""
     # Check for DRY_RUN mode
@@ -95,173 +160,275 @@ def fetch_all_fixtures():
         logger.info("⚡ MODE is DRY_RUN: Using mock data instead of live API")
         return get_mock_fixtures()
 
-    all_fixtures = []
-    
     # Debug API Key (Masked)
-    if API_KEY:
-        masked_key = f"{API_KEY[:4]}...{API_KEY[-4:]}" if len(API_KEY) > 8 else "***"
-        logger.info(f"Using API Key: {masked_key} (Length: {len(API_KEY)})")
+    api_key = _get_api_key()
+    if api_key:
+        masked_key = f"{api_key[:4]}...{api_key[-4:]}" if len(api_key) > 8 else "***"
+        logger.info(f"Using API Key: {masked_key} (Length: {len(api_key)})")
     else:
         logger.error("❌ API Key is MISSING or EMPTY")
 
-    for league in LEAGUES:
+    # Leagues are independent HTTP requests: overlap them so wall time is the
+    # slowest league rather than the sum
+    return asyncio.run(_fetch_all_leagues(api_key))
+
+
+def _parse_commence_time(value):
+    """Parse an API commence_time such as '2024-01-05T15:00:00Z' to naive UTC.
+
+    datetime.fromisoformat is implemented in C and much faster than strptime.
+    """
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+
+
+def _fixtures_in_window(fixtures, max_hours, now=None):
+    """Return the fixtures starting between now and now + max_hours.
+
+    ``now`` is a naive UTC datetime; it defaults to the current time.
+    """
+    if now is None:
+        now = datetime.utcnow()
+    latest = now + timedelta(hours=max_hours)
+    
+    in_window = []
+    for fixture in fixtures:
         try:
-            response = requests.get(
-                f'{BASE_URL}/sports/{league}/odds',
-                params={
-                    'apiKey': API_KEY,
-                    'regions': 'uk,eu,us',
-                    'markets': 'h2h,totals', # Added totals for better mock parity
-                    'oddsFormat': 'decimal'
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                fixtures = response.json()
-                for fixture in fixtures:
-                    fixture['league'] = league
-                all_fixtures.extend(fixtures)
-                logger.info(f"✓ {league}: {len(fixtures)} fixtures")
-            elif response.status_code == 401:
-                logger.error(f"⛔ {league}: 401 Unauthorized - Check API Key/Quota. {response.text}")
-            else:
-                logger.warning(f"✗ {league}: {response.status_code} - {response.text}")
-                
+            commence_time = _parse_commence_time(fixture['commence_time'])
         except Exception as e:
-            logger.error(f"Error fetching {league}: {e}")
+            logger.error(f"Error analyzing fixture: {e}")
+            continue
+        if now <= commence_time <= latest:
+            in_window.append(fixture)
+    return in_window
+
+
+def _best_prices(bookmakers, home_team, away_team):
+    """Return the best (home, away, draw, over) prices across all bookmakers.
+
+    Scans every bookmaker's markets once, covering both the h2h and totals
+    markets; a price of 0.0 means no bookmaker offered that outcome.
+    """
+    best_home = best_away = best_draw = best_over = 0.0
     
-    return all_fixtures
+    # Empty-tuple defaults are shared constants, so a missing key allocates nothing
+    for bookmaker in bookmakers:
+        for market in bookmaker.get('markets', ()):
+            key = market.get('key')
+            if key == 'h2h':
+                for outcome in market.get('outcomes', ()):
+                    name = outcome['name']
+                    price = outcome['price']
+                    if name == home_team:
+                        if price > best_home:
+                            best_home = price
+                    elif name == away_team:
+                        if price > best_away:
+                            best_away = price
+                    elif name.lower() == 'draw':
+                        if price > best_draw:
+                            best_draw = price
+            elif key == 'totals' or key == 'over_under':
+                for outcome in market.get('outcomes', ()):
+                    if outcome['name'].lower().startswith('over') and outcome['price'] > best_over:
+                        best_over = outcome['price']
+    
+    return best_home, best_away, best_draw, best_over
 
 
-def analyze_fixture(fixture, predictor, max_hours=36):
+def _predict_per_fixture(candidates, prediction_inputs, predictor):
+    """Predict each candidate's markets on their own after a failed batch call.
+    
+    Returns the candidates that could be predicted and a prediction list
+    aligned with ``prediction_inputs`` (``None`` for dropped fixtures).
+    """
+    kept = []
+    predictions = [None] * len(prediction_inputs)
+    for candidate in candidates:
+        indices = [
+            i for i in (candidate['h2h_index'], candidate['totals_index']) if i is not None
+        ]
+        try:
+            fixture_predictions = predictor.predict_batch(
+                [prediction_inputs[i] for i in indices]
+            )
+        except Exception as e:
+            logger.error(f"Error predicting fixture {candidate['fixture'].get('id')}: {e}")
+            continue
+        for i, prediction in zip(indices, fixture_predictions):
+            predictions[i] = prediction
+        kept.append(candidate)
+    return kept, predictions
+
+
+def analyze_fixture(fixture, predictor, max_hours=36, now=None):
     """Analyze a fixture and generate recommendations for multiple markets."""
-    try:
-        # Check time window
-        commence_time = datetime.strptime(fixture['commence_time'], '%Y-%m-%dT%H:%M:%SZ')
-        now = datetime.utcnow()
-        if commence_time < now or commence_time > now + timedelta(hours=max_hours):
-            return []
+    return analyze_fixtures([fixture], predictor, max_hours=max_hours, now=now)
 
-        # Extract all odds
-        bookmakers = fixture.get('bookmakers', [])
-        if not bookmakers:
-            return []
-        
-        home_team = fixture['home_team']
-        away_team = fixture['away_team']
-        
-        # We'll collect multiple recommendations per fixture
-        recommendations = []
-        
-        # 1. H2H Market Analysis
-        best_home = 0.0
-        best_away = 0.0
-        best_draw = 0.0
-        
-        for bookmaker in bookmakers:
-            for market in bookmaker.get('markets', []):
-                if market.get('key') == 'h2h':
-                    for outcome in market.get('outcomes', []):
-                        if outcome['name'] == home_team:
-                            best_home = max(best_home, outcome['price'])
-                        elif outcome['name'] == away_team:
-                            best_away = max(best_away, outcome['price'])
-                        elif outcome['name'].lower() == 'draw':
-                            best_draw = max(best_draw, outcome['price'])
-        
-        if best_home > 0 and best_away > 0:
-            # Get H2H sentiment (mock for now if no real one)
-            real_sentiment = get_match_sentiment(fixture['id'])
-            if real_sentiment:
-                sentiment_score = real_sentiment['aggregate_score']
-                sample_count = real_sentiment['sample_count']
-            else:
-                odds_diff = (1.0/best_home) - (1.0/best_away)
-                sentiment_score = odds_diff * 0.5
-                sample_count = 10
+
+def analyze_fixtures(fixtures, predictor, max_hours=36, now=None):
+    """Analyze fixtures and generate recommendations for multiple markets.
+    
+    Odds and sentiment are gathered per fixture first, then every market
+    prediction is made with a single ``predictor.predict_batch`` call. If that
+    call fails, fixtures are predicted one at a time so only the bad one is lost.
+    ``now`` (naive UTC) anchors the kick-off window; defaults to the current time.
+    """
+    # 1. Drop fixtures outside the time window before any odds or sentiment work
+    fixtures = _fixtures_in_window(fixtures, max_hours, now=now)
+    
+    # 2. Gather best prices and prediction inputs for each remaining fixture
+    candidates = []
+    prediction_inputs = []
+    for fixture in fixtures:
+        try:
+            # Extract all odds
+            bookmakers = fixture.get('bookmakers', [])
+            if not bookmakers:
+                continue
+            
+            best_home, best_away, best_draw, best_over = _best_prices(
+                bookmakers, fixture['home_team'], fixture['away_team']
+            )
+            
+            candidate = {
+                'fixture': fixture,
+                'best_home': best_home,
+                'best_away': best_away,
+                'best_draw': best_draw,
+                'best_over': best_over,
+                'h2h_index': None,
+                'totals_index': None,
+            }
+            
+            sentiment_score = 0.0
+            if best_home > 0 and best_away > 0:
+                # Get H2H sentiment (mock for now if no real one)
+                real_sentiment = get_match_sentiment(fixture['id'])
+                if real_sentiment:
+                    sentiment_score = real_sentiment['aggregate_score']
+                    sample_count = real_sentiment['sample_count']
+                else:
+                    odds_diff = (1.0/best_home) - (1.0/best_away)
+                    sentiment_score = odds_diff * 0.5
+                    sample_count = 10
                 
-            prediction = predictor.predict({
-                'market_type': 'h2h',
-                'sentiment_score': sentiment_score,
-                'home_odds': best_home,
-                'away_odds': best_away,
-                'draw_odds': best_draw or 3.0,
-                'sample_count': sample_count
-            })
+                candidate['h2h_index'] = len(prediction_inputs)
+                prediction_inputs.append({
+                    'market_type': 'h2h',
+                    'sentiment_score': sentiment_score,
+                    'home_odds': best_home,
+                    'away_odds': best_away,
+                    'draw_odds': best_draw or 3.0,
+                    'sample_count': sample_count
+                })
+            
+            if best_over > 1.1:
+                candidate['totals_index'] = len(prediction_inputs)
+                prediction_inputs.append({
+                    'market_type': 'totals',
+                    'sentiment_score': sentiment_score
+                })
+            
+            if candidate['h2h_index'] is not None or candidate['totals_index'] is not None:
+                candidates.append(candidate)
+            
+        except Exception as e:
+            logger.error(f"Error analyzing fixture: {e}")
+    
+    if not candidates:
+        return []
+    
+    # 3. One batched model call for every market of every fixture
+    try:
+        predictions = predictor.predict_batch(prediction_inputs)
+    except Exception as e:
+        logger.error(f"Error predicting fixtures in one batch, retrying per fixture: {e}")
+        candidates, predictions = _predict_per_fixture(candidates, prediction_inputs, predictor)
+    
+    # 4. Turn predictions into recommendations
+    results = []
+    for candidate in candidates:
+        fixture = candidate['fixture']
+        try:
+            # We'll collect multiple recommendations per fixture
+            recommendations = []
             
-            if prediction['confidence'] >= 0.60:
-                res = prediction['predicted_outcome']
-                odds = best_home if res == 'home' else best_away if res == 'away' else best_draw
-                prob = prediction['confidence'] # Use sentiment-adjusted confidence as prob
-                ev = (prob * odds) - 1
-                if ev > 0.01:
+            # H2H Market Analysis
+            if candidate['h2h_index'] is not None:
+                prediction = predictions[candidate['h2h_index']]
+                if prediction['confidence'] >= 0.60:
+                    res = prediction['predicted_outcome']
+                    odds = (
+                        candidate['best_home'] if res == 'home'
+                        else candidate['best_away'] if res == 'away'
+                        else candidate['best_draw']
+                    )
+                    prob = prediction['confidence'] # Use sentiment-adjusted confidence as prob
+                    ev = (prob * odds) - 1
+                    if ev > 0.01:
+                        recommendations.append({
+                            'market': 'Match Winner',
+                            'prediction': res.upper(),
+                            'odds': odds,
+                            'confidence': prediction['confidence'],
+                            'ev': ev,
+                            'expected_value': ev,
+                            'tier': 1 if ev > 0.1 else 2
+                        })
+
+            # Over/Under Analysis (if available)
+            if candidate['totals_index'] is not None:
+                prediction = predictions[candidate['totals_index']]
+                if prediction['confidence'] >= 0.60:
                     recommendations.append({
-                        'market': 'Match Winner',
-                        'prediction': res.upper(),
-                        'odds': odds,
+                        'market': 'Over/Under 2.5',
+                        'prediction': prediction['predicted_outcome'].upper(),
+                        'odds': candidate['best_over'], # Simplified
                         'confidence': prediction['confidence'],
-                        'ev': ev,
-                        'expected_value': ev,
-                        'tier': 1 if ev > 0.1 else 2
+                        'ev': 0.05, # Conservative estimate
+                        'expected_value': 0.05,
+                        'tier': 2
                     })
 
-        # 2. Over/Under Analysis (if available)
-        best_over = 0.0
-        for bookmaker in bookmakers:
-            for market in bookmaker.get('markets', []):
-                if market.get('key') in ['totals', 'over_under']:
-                    for outcome in market.get('outcomes', []):
-                        if outcome['name'].lower().startswith('over'):
-                            best_over = max(best_over, outcome['price'])
-        
-        if best_over > 1.1:
-            prediction = predictor.predict({
-                'market_type': 'totals',
-                'sentiment_score': sentiment_score if 'sentiment_score' in locals() else 0.0
-            })
-            if prediction['confidence'] >= 0.60:
-                recommendations.append({
-                    'market': 'Over/Under 2.5',
-                    'prediction': prediction['predicted_outcome'].upper(),
-                    'odds': best_over, # Simplified
-                    'confidence': prediction['confidence'],
-                    'ev': 0.05, # Conservative estimate
-                    'expected_value': 0.05,
-                    'tier': 2
+            # Finalize recommendations with fixture info
+            for rec in recommendations:
+                results.append({
+                    'fixture_id': fixture['id'],
+                    'league': fixture['league'],
+                    'home_team': fixture['home_team'],
+                    'away_team': fixture['away_team'],
+                    'commence_time': fixture['commence_time'],
+                    **rec
                 })
-
-        # Finalize recommendations with fixture info
-        results = []
-        for rec in recommendations:
-            results.append({
-                'fixture_id': fixture['id'],
-                'league': fixture['league'],
-                'home_team': home_team,
-                'away_team': away_team,
-                'commence_time': fixture['commence_time'],
-                **rec
-            })
-        
-        return results
-        
-    except Exception as e:
-        logger.error(f"Error analyzing fixture: {e}")
-        return []
+            
+        except Exception as e:
+            logger.error(f"Error analyzing fixture: {e}")
+    
+    return results
 
 
 def generate_daily_report(recommendations):
     """Generate formatted daily report."""
+    return "\n".join(_daily_report_lines(recommendations))
+
+
+def _daily_report_lines(recommendations):
+    """Build the daily report as a list of lines (without newlines)."""
     if not recommendations:
-        return "❌ No recommendations found today"
+        return ["❌ No recommendations found today"]
     
-    # Sort by tier and confidence
-    recommendations.sort(key=lambda x: (x['tier'], -x['confidence']))
+    # Sort by tier, then confidence descending: two stable itemgetter sorts avoid
+    # building a key tuple per recommendation
+    recommendations.sort(key=itemgetter('confidence'), reverse=True)
+    recommendations.sort(key=itemgetter('tier'))
     
-    # Group by tier
-    tier1 = [r for r in recommendations if r['tier'] == 1]
-    tier2 = [r for r in recommendations if r['tier'] == 2]
-    tier3 = [r for r in recommendations if r['tier'] == 3]
+    # Group by tier in a single pass (buckets keep the confidence order)
+    tier1, tier2, tier3 = [], [], []
+    buckets = {1: tier1, 2: tier2, 3: tier3}
+    for rec in recommendations:
+        bucket = buckets.get(rec['tier'])
+        if bucket is not None:
+            bucket.append(rec)
     
     report = []
     report.append("=" * 70)
@@ -305,7 +472,7 @@ def generate_daily_report(recommendations):
     report.append(f"🎯 TARGET: 5+ opportunities (Status: {'✅ MET' if len(recommendations) >= 5 else '⚠️ BELOW TARGET'})")
     report.append("=" * 70)
     
-    return "\n".join(report)
+    return report
 
 
 def main():
@@ -328,12 +495,9 @@ def main():
     
     # Analyze fixtures
     print("🔍 Analyzing fixtures with ML model...")
-    recommendations = []
-    
-    for fixture in fixtures:
-        recs = analyze_fixture(fixture, predictor)
-        if recs:
-            recommendations.extend(recs)
+    # Sample the clock once for the whole run
+    now = datetime.utcnow()
+    recommendations = analyze_fixtures(fixtures, predictor, now=now)
     
     print(f"✓ Generated {len(recommendations)} recommendations")
     print()
@@ -346,13 +510,14 @@ def main():
     stats = analytics.calculate_stats(recommendations)
     
     # Generate report
-    report = generate_daily_report(recommendations)
-    print(report)
+    # Stream the report lines to stdout and the file instead of joining one big string
+    report_lines = _daily_report_lines(recommendations)
+    sys.stdout.writelines(f"{line}\n" for line in report_lines)
     
     # Save to file
     report_file = f"daily_odds_{datetime.now().strftime('%Y%m%d')}.txt"
     with open(report_file, 'w') as f:
-        f.write(report)
+        f.writelines(f"{line}\n" for line in report_lines)
     
     print()
     print(f"📄 Report saved to: {report_file}")
@@ -12,12 +12,33 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import gc
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from heapq import merge
+from operator import itemgetter
 from pathlib import Path
 
 import pandas as pd
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# --- Optional: inotify/FSEvents model reload notifications
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
 from src.adapters.theodds_api import TheOddsAPIAdapter
 from src.adapters.betfair import BetfairAdapter
 from src.config import settings
@@ -34,6 +55,34 @@ from src.bot import TelegramBot
 
 logger = get_logger(__name__)
 
+# Upper bound on sports fetched concurrently per check
+MAX_SPORT_WORKERS = 8
+
+MODEL_PATH = Path("models/model.pkl")
+
+# Record layouts of TheOddsAPIAdapter.fetch_fixtures rows and the part of its
+# fetch_odds rows that build_features reads; fixed columns spare pandas from
+# discovering keys row by row on every tick
+FIXTURE_COLUMNS = ("market_id", "start", "home", "away", "sport", "league")
+ODDS_COLUMNS = ("market_id", "selection", "odds")
+
+
+if WATCHDOG_AVAILABLE:
+
+    class _ModelFileHandler(FileSystemEventHandler):
+        """Flag a pending reload when the model file is written, created or moved into place."""
+
+        def __init__(self, dirty: threading.Event):
+            super().__init__()
+            self._dirty = dirty
+
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            paths = (event.src_path, getattr(event, "dest_path", None))
+            if any(path and os.path.basename(path) == MODEL_PATH.name for path in paths):
+                self._dirty.set()
+
 
 class LiveOddsTracker:
     """Track live odds with memory management and auto-reload.
@@ -64,6 +113,9 @@ class LiveOddsTracker:
         # CRITICAL FIX: Model reload tracking
         self.last_model_check = datetime.now(timezone.utc)
         self.model_mtime = self._get_model_mtime()
+        # Set by the file watcher (when running) instead of polling on an interval
+        self._model_dirty = threading.Event()
+        self._model_observer = None
 
         # Load model
         self.model = ModelWrapper()
@@ -87,29 +139,67 @@ class LiveOddsTracker:
         Returns:
             Modification timestamp, or 0 if file doesn't exist
         """
-        model_path = Path("models/model.pkl")
-        return model_path.stat().st_mtime if model_path.exists() else 0.0
+        return MODEL_PATH.stat().st_mtime if MODEL_PATH.exists() else 0.0
+
+    def _start_model_watcher(self):
+        """Watch the model directory for writes when watchdog is installed.
+
+        Falls back to interval polling in ``_check_and_reload_model`` when
+        watchdog is missing or the directory cannot be watched.
+        """
+        if not WATCHDOG_AVAILABLE or self._model_observer is not None:
+            return
+
+        observer = Observer()
+        try:
+            observer.schedule(_ModelFileHandler(self._model_dirty), str(MODEL_PATH.parent))
+            observer.start()
+        except OSError as e:
+            logger.warning(f"Model file watcher unavailable, polling instead: {e}")
+            return
+
+        self._model_observer = observer
+        logger.info(f"Watching {MODEL_PATH.parent} for model updates")
+
+    def _stop_model_watcher(self):
+        """Stop the model file watcher, if one is running."""
+        if self._model_observer is None:
+            return
+
+        self._model_observer.stop()
+        self._model_observer.join(timeout=5)
+        self._model_observer = None
 
     def _check_and_reload_model(self):
         """Reload model if file has changed.
 
         CRITICAL FIX: Automatic model updates without restart.
         """
-        now = datetime.now(timezone.utc)
+        if self._model_observer is not None:
+            # Event driven: nothing to do until the watcher has seen a write
+            if not self._model_dirty.is_set():
+                return
+            self._model_dirty.clear()
+        else:
+            now = datetime.now(timezone.utc)
 
-        # Only check periodically
-        if (now - self.last_model_check).total_seconds() < self.model_check_interval:
-            return
+            # Only check periodically
+            if (now - self.last_model_check).total_seconds() < self.model_check_interval:
+                return
+
+            self.last_model_check = now
 
-        self.last_model_check = now
         current_mtime = self._get_model_mtime()
 
         if current_mtime > self.model_mtime:
             logger.info("Detected new model file, reloading...")
 
             try:
-                self.model = ModelWrapper()
-                self.model.load("models/model.pkl")
+                # Load into a fresh wrapper first so a half-written file (the watcher can
+                # fire mid-write) leaves the current model in place
+                model = ModelWrapper()
+                model.load(str(MODEL_PATH))
+                self.model = model
                 self.model_mtime = current_mtime
 
                 logger.info("✅ Model reloaded successfully")
@@ -146,6 +236,89 @@ class LiveOddsTracker:
             except ImportError:
                 pass  # psutil not available
 
+    def _process_sport(self, sport, start_date, end_date):
+        """Fetch, score and value-filter the fixtures of a single sport.
+
+        Runs on a worker thread, so the sport is passed explicitly to the
+        adapter instead of mutating its shared ``default_sport``.
+
+        Args:
+            sport: Sport key (e.g. ``soccer_epl``)
+            start_date: Earliest kick-off to consider
+            end_date: Latest kick-off to consider
+
+        Returns:
+            List of value bets found for the sport (empty on error)
+        """
+        # Pin the model for this pass so a concurrent reload cannot swap it mid-way
+        model = self.model
+        source = self.fetcher.source
+
+        try:
+            logger.info(f"Fetching data for {sport}...")
+
+            # Fetch data
+            fixtures_list = source.fetch_fixtures(
+                sport=sport,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            fixtures = pd.DataFrame.from_records(fixtures_list, columns=FIXTURE_COLUMNS)
+
+            if fixtures.empty:
+                return []
+
+            market_ids = fixtures["market_id"].tolist()
+            if not market_ids:
+                return []
+
+            odds_list = source.fetch_odds(sport=sport, market_ids=market_ids)
+            odds = pd.DataFrame.from_records(odds_list, columns=ODDS_COLUMNS, coerce_float=True)
+
+            if odds.empty:
+                return []
+
+            features = build_features(fixtures, odds)
+
+            # Prediction logic
+            if model is None:
+                features["prob_home"] = features["implied_prob_home"]
+            else:
+                try:
+                    X = features.drop(columns=["market_id", "result"], errors="ignore")
+                    X_selected = select_features(X)
+                    # Already normalized to the 1-D positive-class column
+                    features["prob_home"] = model.predict_pos_proba(X_selected)
+                except Exception as e:
+                    logger.error(f"Prediction error for {sport}: {e}")
+                    # Fallback to implied probability
+                    if "implied_prob_home" in features.columns:
+                        features["prob_home"] = features["implied_prob_home"]
+                    elif "home_odds" in features.columns:
+                        features["prob_home"] = 1.0 / features["home_odds"]
+                    else:
+                        logger.warning(f"Could not calculate probability for {sport}")
+                        return []
+
+            # Find value bets
+            bets = find_value_bets(
+                features,
+                proba_col="prob_home",
+                odds_col="home_odds",
+                min_ev=settings.MIN_EV,
+                bank=10000,
+                # apply_bet_filters drops these later; screening them here skips sizing
+                min_confidence=settings.MIN_CONFIDENCE,
+            )
+
+            if bets:
+                logger.info(f"Found {len(bets)} value bets for {sport}")
+            return bets
+
+        except Exception as e:
+            logger.error(f"Error processing {sport}: {e}", exc_info=True)
+            return []
+
     def check_opportunities(self):
         """Check for current betting opportunities with error handling."""
         # CRITICAL: Check Kill Switch
@@ -161,86 +334,27 @@ class LiveOddsTracker:
             # CRITICAL FIX: Check for model updates
             self._check_and_reload_model()
 
-            all_opportunities = []
-            
-            # Iterate through all active sports
-            for sport in settings.ACTIVE_SPORTS:
-                try:
-                    logger.info(f"Fetching data for {sport}...")
-                    
-                    # Update fetcher sport
-                    if hasattr(self.fetcher.source, 'default_sport'):
-                        self.fetcher.source.default_sport = sport
-                    
-                    # Fetch data
-                    fixtures_list = self.fetcher.source.fetch_fixtures(
-                        start_date=datetime.now(timezone.utc),
-                        end_date=datetime.now(timezone.utc) + timedelta(days=7),
-                    )
-                    fixtures = pd.DataFrame(fixtures_list)
-
-                    if fixtures.empty:
-                        continue
-
-                    market_ids = fixtures["market_id"].tolist()
-                    if not market_ids:
-                        continue
-
-                    odds_list = self.fetcher.source.fetch_odds(market_ids)
-                    odds = pd.DataFrame(odds_list)
-                    
-                    if odds.empty:
-                        continue
-
-                    features = build_features(fixtures, odds)
-                    
-                    # Prediction logic
-                    if self.model is None:
-                        features["prob_home"] = features["implied_prob_home"]
-                    else:
-                        try:
-                            X = features.drop(columns=["market_id", "result"], errors="ignore")
-                            X_selected = select_features(X)
-                            probs = self.model.predict_proba(X_selected)
-                            
-                            # Handle different prediction output formats
-                            if hasattr(probs, "shape") and len(probs.shape) > 1 and probs.shape[1] > 1:
-                                features["prob_home"] = probs[:, 1]
-                            else:
-                                features["prob_home"] = probs
-                        except Exception as e:
-                            logger.error(f"Prediction error for {sport}: {e}")
-                            # Fallback to implied probability
-                            if "implied_prob_home" in features.columns:
-                                features["prob_home"] = features["implied_prob_home"]
-                            elif "home_odds" in features.columns:
-                                features["prob_home"] = 1.0 / features["home_odds"]
-                            else:
-                                logger.warning(f"Could not calculate probability for {sport}")
-                                continue
-
-                    # Find value bets
-                    bets = find_value_bets(
-                        features,
-                        proba_col="prob_home",
-                        odds_col="home_odds",
-                        min_ev=settings.MIN_EV,
-                        bank=10000,
-                    )
-                    
-                    if bets:
-                        logger.info(f"Found {len(bets)} value bets for {sport}")
-                        all_opportunities.extend(bets)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing {sport}: {e}", exc_info=True)
-                    continue
+            # One fixture window per tick, shared by every sport
+            now = datetime.now(timezone.utc)
+            horizon = now + timedelta(days=7)
+
+            # Sports are independent and I/O bound, so fetch them concurrently;
+            # total wall time is the slowest sport rather than the sum
+            sports = list(settings.ACTIVE_SPORTS)
+            with ThreadPoolExecutor(
+                max_workers=max(min(len(sports), MAX_SPORT_WORKERS), 1),
+                thread_name_prefix="live-sport",
+            ) as executor:
+                results = list(
+                    executor.map(lambda sport: self._process_sport(sport, now, horizon), sports)
+                )
+            # find_value_bets returns each sport already sorted by EV, so a k-way merge
+            # yields the global EV order without re-sorting the combined list
+            all_opportunities = list(merge(*results, key=itemgetter("ev"), reverse=True))
 
             if not all_opportunities:
                 logger.info("No value bets found across all sports")
                 return []
-            # Sort and filter
-            all_opportunities.sort(key=lambda x: x["ev"], reverse=True)
             
             # Apply filters
             opportunities = apply_bet_filters(
@@ -317,10 +431,21 @@ class LiveOddsTracker:
                 print(f"  - {status} (DB ID: {db_id})")
 
         # Save to file
-        import json
-
-        with open(self.opportunities_file, "w") as f:
-            json.dump(opportunities, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            # Serializes numpy scalars and datetimes natively; str() only for anything else
+            with open(self.opportunities_file, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        opportunities,
+                        default=str,
+                        option=orjson.OPT_INDENT_2
+                        | orjson.OPT_SERIALIZE_NUMPY
+                        | orjson.OPT_NAIVE_UTC,
+                    )
+                )
+        else:
+            with open(self.opportunities_file, "w") as f:
+                json.dump(opportunities, f, indent=2, default=str)
 
     def run_continuous(self):
         """Run continuous monitoring with memory management."""
@@ -335,6 +460,7 @@ class LiveOddsTracker:
 
         # Start Telegram Bot
         self.bot.start()
+        self._start_model_watcher()
 
         try:
             while True:
@@ -379,6 +505,7 @@ class LiveOddsTracker:
             raise
 
         finally:
+            self._stop_model_watcher()
             self.bot.stop()
 
     def run_once(self):
@@ -100,7 +100,7 @@ class MultiLeagueTracker:
             else:
                 X = features.drop(columns=["market_id", "result"], errors="ignore")
                 X_selected = select_features(X)
-                preds = self.model.predict_proba(X_selected.values)[:, 1]
+                preds = self.model.predict_pos_proba(X_selected)
                 features["p_win"] = preds
 
             features["odds"] = features.get("home", 2.0)
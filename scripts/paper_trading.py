@@ -4,6 +4,8 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
 try:
     from src.adapters.theodds_api import TheOddsAPIAdapter
     from src.config import settings
@@ -91,7 +93,7 @@ class PaperTradingSystem:
             X_selected = select_features(X)
 
             # Make predictions
-            predictions = self.model.predict_proba(X_selected.values)[:, 1]
+            predictions = self.model.predict_pos_proba(X_selected)
             features["p_win"] = predictions
 
         # Prepare for value bet detection
@@ -203,22 +205,28 @@ class PaperTradingSystem:
             }
 
         settled = [b for b in self.bets if b["status"] == "settled"]
-        pending = [b for b in self.bets if b["status"] == "pending"]
-        wins = [b for b in settled if b["result"] == "win"]
-        losses = [b for b in settled if b["result"] == "loss"]
+        n_settled = len(settled)
+
+        # Gather settled fields into arrays sized up front instead of growing
+        # lists, then derive every count and total with array reductions
+        won = np.fromiter((b["result"] == "win" for b in settled), dtype=bool, count=n_settled)
+        lost = np.fromiter((b["result"] == "loss" for b in settled), dtype=bool, count=n_settled)
+        stakes = np.fromiter((b["stake"] for b in settled), dtype=np.float64, count=n_settled)
+        profits = np.fromiter((b["profit"] for b in settled), dtype=np.float64, count=n_settled)
 
-        total_staked = sum(b["stake"] for b in settled)
-        total_profit = sum(b["profit"] for b in settled)
+        n_wins = int(np.count_nonzero(won))
+        total_staked = float(stakes.sum())
+        total_profit = float(profits.sum())
 
         return {
             "total_bets": len(self.bets),
-            "pending": len(pending),
-            "settled": len(settled),
-            "wins": len(wins),
-            "losses": len(losses),
+            "pending": sum(1 for b in self.bets if b["status"] == "pending"),
+            "settled": n_settled,
+            "wins": n_wins,
+            "losses": int(np.count_nonzero(lost)),
             "total_staked": total_staked,
             "total_profit": total_profit,
-            "win_rate": len(wins) / len(settled) if settled else 0,
+            "win_rate": n_wins / n_settled if n_settled else 0,
             "roi": (total_profit / total_staked * 100) if total_staked > 0 else 0,
             "current_bankroll": self.bankroll,
             "bankroll_change": self.bankroll - self.initial_bankroll,
@@ -241,7 +249,10 @@ class PaperTradingSystem:
         print(f"{'ID':<4} {'Match':<40} {'Odds':<7} {'Prob':<7} {'Edge':<7} {'Stake':<10}")
         print("-" * 80)
 
+        # Total the stakes while printing rows rather than in a second pass
+        total_stake = 0.0
         for i, bet in enumerate(bets, 1):
+            total_stake += bet["stake"]
             match = f"{bet.get('home', 'TBD')} vs {bet.get('away', 'TBD')}"
             if len(match) > 38:
                 match = match[:35] + "..."
@@ -251,7 +262,6 @@ class PaperTradingSystem:
                 f"{bet['ev']:<7.1%} ${bet['stake']:<9.2f}"
             )
 
-        total_stake = sum(b["stake"] for b in bets)
         print("-" * 80)
         print(f"{'TOTAL':<52} ${total_stake:,.2f} ({total_stake/self.bankroll:.1%} of bankroll)")
         print("=" * 80 + "\n")
@@ -2,7 +2,6 @@
 import json
 import os
 import sys
-from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
@@ -56,37 +55,37 @@ class PaperTradingReporter:
         if not settled:
             return None
 
-        wins = [b for b in settled if b.get("result") == "win"]
-        losses = [b for b in settled if b.get("result") == "loss"]
-
-        total_staked = sum(b["stake"] for b in settled)
-        total_profit = sum(b.get("profit", 0) for b in settled)
-
-        # Calculate by confidence bands
-        confidence_bands = defaultdict(lambda: {"count": 0, "wins": 0, "staked": 0, "profit": 0})
-
-        for bet in settled:
-            conf = bet.get("confidence", 0.5)
-            band = self.get_confidence_band(conf)
-            confidence_bands[band]["count"] += 1
-            confidence_bands[band]["staked"] += bet["stake"]
-            confidence_bands[band]["profit"] += bet.get("profit", 0)
-            if bet.get("result") == "win":
-                confidence_bands[band]["wins"] += 1
-
-        # Calculate by league
-        league_stats = defaultdict(lambda: {"count": 0, "wins": 0, "staked": 0, "profit": 0})
-
-        for bet in settled:
-            league = bet.get("league", "Unknown")
-            league_stats[league]["count"] += 1
-            league_stats[league]["staked"] += bet["stake"]
-            league_stats[league]["profit"] += bet.get("profit", 0)
-            if bet.get("result") == "win":
-                league_stats[league]["wins"] += 1
+        # Reduce settled bets column-wise instead of one generator pass per metric
+        df = pd.DataFrame(settled)
+        stakes = df["stake"].to_numpy(dtype=float)
+        profits = df.get("profit", pd.Series(0.0, index=df.index)).fillna(0).to_numpy(dtype=float)
+        outcomes = df.get("result", pd.Series(None, index=df.index, dtype=object))
+        is_win = outcomes.eq("win").to_numpy()
+
+        wins = int(is_win.sum())
+        losses = int(outcomes.eq("loss").sum())
+        total_staked = float(stakes.sum())
+        total_profit = float(profits.sum())
+
+        per_bet = pd.DataFrame(
+            {
+                "band": df.get("confidence", pd.Series(0.5, index=df.index))
+                .fillna(0.5)
+                .map(self.get_confidence_band),
+                "league": df.get("league", pd.Series("Unknown", index=df.index)).fillna(
+                    "Unknown"
+                ),
+                "wins": is_win.astype(int),
+                "staked": stakes,
+                "profit": profits,
+            }
+        )
+
+        # Calculate by confidence bands and by league
+        confidence_bands = self._group_stats(per_bet, "band")
+        league_stats = self._group_stats(per_bet, "league")
 
         # Time series data
-        df = pd.DataFrame(settled)
         df["placed_at"] = pd.to_datetime(df["placed_at"])
         df["cumulative_profit"] = df["profit"].cumsum()
 
@@ -94,21 +93,40 @@ class PaperTradingReporter:
             "total_bets": len(self.bets),
             "settled": len(settled),
             "pending": len(self.bets) - len(settled),
-            "wins": len(wins),
-            "losses": len(losses),
-            "win_rate": len(wins) / len(settled) if settled else 0,
+            "wins": wins,
+            "losses": losses,
+            "win_rate": wins / len(settled) if settled else 0,
             "total_staked": total_staked,
             "total_profit": total_profit,
             "roi": (total_profit / total_staked * 100) if total_staked > 0 else 0,
             "avg_stake": total_staked / len(settled) if settled else 0,
-            "avg_odds": sum(b["odds"] for b in settled) / len(settled) if settled else 0,
-            "confidence_bands": dict(confidence_bands),
-            "league_stats": dict(league_stats),
+            "avg_odds": float(df["odds"].mean()) if settled else 0,
+            "confidence_bands": confidence_bands,
+            "league_stats": league_stats,
             "time_series": df[["placed_at", "cumulative_profit"]].to_dict("records")
             if not df.empty
             else [],
         }
 
+    @staticmethod
+    def _group_stats(per_bet, key):
+        """Aggregate count, wins, staked and profit per value of ``key``."""
+        grouped = per_bet.groupby(key, sort=False).agg(
+            count=("wins", "size"),
+            wins=("wins", "sum"),
+            staked=("staked", "sum"),
+            profit=("profit", "sum"),
+        )
+        return {
+            name: {
+                "count": int(row.count),
+                "wins": int(row.wins),
+                "staked": float(row.staked),
+                "profit": float(row.profit),
+            }
+            for name, row in zip(grouped.index, grouped.itertuples(index=False))
+        }
+
     def get_confidence_band(self, confidence):
         """Get confidence band label."""
         if confidence < 0.55:
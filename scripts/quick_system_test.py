@@ -106,7 +106,7 @@ def test_complete_workflow():
         backtester = Backtester(initial_bankroll=10000.0)
 
         # Create sample historical data
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n = 20
 
         # Fixtures
@@ -119,11 +119,11 @@ def test_complete_workflow():
         )
 
         # Odds - format expected by build_features
+        home_odds = rng.uniform(1.5, 3.5, n)
+        away_odds = rng.uniform(1.5, 3.5, n)
         odds_list = []
-        for i in range(n):
+        for i, (home_odd, away_odd) in enumerate(zip(home_odds, away_odds)):
             market_id = f"H{i}"
-            home_odd = np.random.uniform(1.5, 3.5)
-            away_odd = np.random.uniform(1.5, 3.5)
             odds_list.extend(
                 [
                     {
@@ -144,7 +144,7 @@ def test_complete_workflow():
 
         # Results
         results_df = pd.DataFrame(
-            {"market_id": fixtures["market_id"], "result": np.random.choice(["home", "away"], n)}
+            {"market_id": fixtures["market_id"], "result": rng.choice(["home", "away"], n)}
         )
 
         # Run backtest
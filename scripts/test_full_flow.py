@@ -32,7 +32,8 @@ def test_full_flow():
         "home": "Test Home Team",
         "away": "Test Away Team",
         "start": datetime.now(timezone.utc) + timedelta(hours=1),
-        "sport": "soccer_epl"
+        "sport": "soccer_epl",
+        "league": "EPL"
     }]
     tracker.fetcher.source.fetch_fixtures.return_value = fixtures_data
     
@@ -49,7 +50,7 @@ def test_full_flow():
     tracker.model = MagicMock()
     # Return probability > 1/odds (1/3.0 = 0.33). Let's say 0.5 (50%)
     # 0.5 * 3.0 = 1.5 EV (50% edge)
-    tracker.model.predict_proba.return_value = 0.5
+    tracker.model.predict_pos_proba.return_value = 0.5
     
     # Force ACTIVE_SPORTS to just one for test
     settings.ACTIVE_SPORTS = ["soccer_epl"]
@@ -75,15 +75,15 @@ def test_on_real_data():
     print("🔧 Building training features...")
     train_features = build_features(train_fixtures, train_odds)
     train_features = train_features.merge(train_results, on="market_id", how="left")
-    train_features["label"] = (train_features["result"] == "home").astype(int)
-    train_features_clean = train_features.dropna(subset=["label"])
+    train_features["label"] = (train_features["result"] == "home").astype(np.int8)
+    train_features_clean = train_features.dropna(subset=["result"])
 
     # CRITICAL: Remove result columns to prevent data leakage
     X_train = train_features_clean.drop(
         columns=["label", "market_id", "result", "home_score", "away_score"], errors="ignore"
     )
-    X_train_numeric = X_train.select_dtypes(include=["number"]).fillna(0)
-    y_train = train_features_clean["label"].values
+    X_train_numeric = X_train.select_dtypes(include=["number"]).astype(np.float32).fillna(0)
+    y_train = train_features_clean["label"].to_numpy()
 
     print(f"   ✅ {len(y_train)} training samples")
     print(f"   ✅ {X_train_numeric.shape[1]} features\n")
@@ -91,29 +91,29 @@ def test_on_real_data():
     # Train model
     print("🤖 Training model on real data...")
     model = ModelWrapper()
-    model.train(X_train_numeric.values, y_train)
+    model.train(X_train_numeric, y_train)
     print("   ✅ Model trained\n")
 
     # Build features for testing
     print("🔧 Building test features...")
     test_features = build_features(test_fixtures, test_odds)
     test_features = test_features.merge(test_results, on="market_id", how="left")
-    test_features["label"] = (test_features["result"] == "home").astype(int)
-    test_features_clean = test_features.dropna(subset=["label"])
+    test_features["label"] = (test_features["result"] == "home").astype(np.int8)
+    test_features_clean = test_features.dropna(subset=["result"])
 
     # CRITICAL: Remove result columns to prevent data leakage
     X_test = test_features_clean.drop(
         columns=["label", "market_id", "result", "home_score", "away_score"], errors="ignore"
     )
-    X_test_numeric = X_test.select_dtypes(include=["number"]).fillna(0)
-    y_test = test_features_clean["label"].values
+    X_test_numeric = X_test.select_dtypes(include=["number"]).astype(np.float32).fillna(0)
+    y_test = test_features_clean["label"].to_numpy()
 
     print(f"   ✅ {len(y_test)} test samples\n")
 
     # Make predictions
     print("🔮 Making predictions...")
-    y_pred_proba = model.predict_proba(X_test_numeric.values)[:, 1]
-    y_pred = (y_pred_proba > 0.5).astype(int)
+    y_pred_proba = model.predict_pos_proba(X_test_numeric)
+    y_pred = (y_pred_proba > 0.5).astype(np.int8)
 
     # Calculate metrics
     print("\n" + "=" * 70)
@@ -146,7 +146,7 @@ def test_on_real_data():
     labels = ["<40%", "40-45%", "45-50%", "50-55%", "55-60%", ">60%"]
 
     test_features_clean["prediction"] = y_pred_proba
-    test_features_clean["correct"] = (y_pred == y_test).astype(int)
+    test_features_clean["correct"] = (y_pred == y_test).astype(np.int8)
     test_features_clean["conf_bin"] = pd.cut(y_pred_proba, bins=confidence_bins, labels=labels)
 
     print(f"{'Confidence':<12} {'Count':<8} {'Win Rate':<12} {'Actual Home %'}")
@@ -13,7 +13,7 @@ from src.backtest import Backtester  # noqa: E402
 from src.db import BetRecord, handle_db_errors, init_db, save_bet, update_bet_result  # noqa: E402
 from src.executor import Executor  # noqa: E402
 from src.feature import add_odds_features, add_temporal_features  # noqa: E402
-from src.risk import kelly_fraction, validate_bet  # noqa: E402
+from src.risk import kelly_stakes, validate_bet  # noqa: E402
 from src.strategy import diversify_bets, filter_bets_by_sharpe, find_value_bets  # noqa: E402
 
 
@@ -110,13 +110,16 @@ def test_3_strategy_evaluation():
         print(f"Evaluating {len(opportunities)} betting opportunities...")
         print(opportunities.to_string(index=False))
 
-        # Find value bets
-        value_bets = find_value_bets(opportunities, min_edge=0.03)
+        # Find value bets (EV is computed once per bet by the strategy as "ev")
+        value_bets = find_value_bets(
+            opportunities.rename(columns={"match_id": "market_id", "market": "selection"}),
+            min_ev=0.03,
+        )
         print(f"\n✅ Found {len(value_bets)} value bets (min edge: 3%)")
 
         if len(value_bets) > 0:
             print(
-                value_bets[["match_id", "market", "odds", "expected_value", "edge"]].to_string(
+                pd.DataFrame(value_bets)[["market_id", "selection", "odds", "ev"]].to_string(
                     index=False
                 )
             )
@@ -126,7 +129,7 @@ def test_3_strategy_evaluation():
             print(f"\n✅ After Sharpe filtering: {len(filtered)} bets")
 
             # Test diversification
-            diversified = diversify_bets(filtered, max_per_match=1)
+            diversified = diversify_bets(filtered, max_per_league=1)
             print(f"✅ After diversification: {len(diversified)} bets")
 
             return diversified
@@ -151,23 +154,28 @@ def test_4_risk_management():
         print(f"Bankroll: ${bankroll:,.2f}")
 
         # Test Kelly criterion
-        test_cases = [
-            {"odds": 2.0, "p_win": 0.55, "edge": 0.10},
-            {"odds": 3.0, "p_win": 0.40, "edge": 0.07},
-            {"odds": 1.5, "p_win": 0.70, "edge": 0.05},
-        ]
+        test_cases = pd.DataFrame(
+            {"odds": [2.0, 3.0, 1.5], "p_win": [0.55, 0.40, 0.70], "edge": [0.10, 0.07, 0.05]}
+        )
+        test_cases["stake"] = kelly_stakes(
+            test_cases["p_win"].to_numpy(), test_cases["odds"].to_numpy(), bankroll
+        )
+        test_cases["pct"] = test_cases["stake"] / bankroll * 100
 
         print("\nKelly Criterion Staking:")
-        print(f"{'Odds':<8} {'P(Win)':<10} {'Edge':<10} {'Stake':<15} {'% of BR'}")
-        print("-" * 60)
-
-        for tc in test_cases:
-            stake = kelly_fraction(win_prob=tc["p_win"], odds=tc["odds"], bankroll=bankroll)
-            pct = (stake / bankroll) * 100
-            print(
-                f"{tc['odds']:<8.2f} {tc['p_win']:<10.2f} {tc['edge']:<10.1%} "
-                f"${stake:<14.2f} {pct:.2f}%"
+        print(
+            test_cases.to_string(
+                index=False,
+                header=["Odds", "P(Win)", "Edge", "Stake", "% of BR"],
+                formatters={
+                    "odds": "{:.2f}".format,
+                    "p_win": "{:.2f}".format,
+                    "edge": "{:.1%}".format,
+                    "stake": "${:.2f}".format,
+                    "pct": "{:.2f}%".format,
+                },
             )
+        )
 
         print("\n✅ Kelly staking working correctly")
 
@@ -282,7 +290,7 @@ def test_7_backtesting():
 
     try:
         # Create historical data
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n_matches = 50
 
         historical_data = pd.DataFrame(
@@ -290,9 +298,9 @@ def test_7_backtesting():
                 "match_id": [f"HIST_{i}" for i in range(n_matches)],
                 "home_team": [f"Team {chr(65 + i % 26)}" for i in range(n_matches)],
                 "away_team": [f"Team {chr(90 - i % 26)}" for i in range(n_matches)],
-                "home_odds": np.random.uniform(1.5, 4.0, n_matches),
-                "away_odds": np.random.uniform(1.5, 4.0, n_matches),
-                "result": np.random.choice(["home", "away"], n_matches),
+                "home_odds": rng.uniform(1.5, 4.0, n_matches),
+                "away_odds": rng.uniform(1.5, 4.0, n_matches),
+                "result": rng.choice(["home", "away"], n_matches),
                 "commence_time": [datetime.now() - timedelta(days=i) for i in range(n_matches)],
             }
         )
@@ -307,12 +315,12 @@ def test_7_backtesting():
             {
                 "match_id": historical_data["match_id"],
                 "home_prob": np.clip(
-                    1.0 / historical_data["home_odds"] + np.random.normal(0, 0.05, n_matches),
+                    1.0 / historical_data["home_odds"] + rng.normal(0, 0.05, n_matches),
                     0.1,
                     0.9,
                 ),
                 "away_prob": np.clip(
-                    1.0 / historical_data["away_odds"] + np.random.normal(0, 0.05, n_matches),
+                    1.0 / historical_data["away_odds"] + rng.normal(0, 0.05, n_matches),
                     0.1,
                     0.9,
                 ),
@@ -371,22 +379,24 @@ def test_8_end_to_end_workflow():
         print("\n1️⃣  Sample Opportunities:")
         print(opportunities.to_string(index=False))
 
-        # 2. Find value bets
-        value_bets = find_value_bets(opportunities, min_edge=0.02)
-        print(f"\n2️⃣  Value Bets Found: {len(value_bets)}")
+        # 2. Find value bets (edge computed once and reused for execution)
+        opportunities["edge"] = (
+            opportunities["p_win"].to_numpy() * opportunities["odds"].to_numpy() - 1.0
+        )
+        edges = opportunities["edge"].to_numpy()
+        strict = edges > 0.02
+        print(f"\n2️⃣  Value Bets Found: {int(strict.sum())}")
 
-        if len(value_bets) == 0:
+        if not strict.any():
             print("   ⚠️  No value found (lowering threshold...)")
-            value_bets = find_value_bets(opportunities, min_edge=0.0)
+            strict = edges > 0.0
+        value_bets = opportunities.loc[strict].copy()
 
         # 3. Calculate stakes
         bankroll = 10000.0
-        stakes = []
-        for _, bet in value_bets.iterrows():
-            stake = kelly_fraction(win_prob=bet["p_win"], odds=bet["odds"], bankroll=bankroll)
-            stakes.append(stake)
-
-        value_bets["stake"] = stakes
+        value_bets["stake"] = kelly_stakes(
+            value_bets["p_win"].to_numpy(), value_bets["odds"].to_numpy(), bankroll
+        )
         print("\n3️⃣  Stakes Calculated:")
         print(value_bets[["home_team", "market", "odds", "stake"]].to_string(index=False))
 
@@ -395,20 +405,39 @@ def test_8_end_to_end_workflow():
         executed_count = 0
 
         print("\n4️⃣  Executing Bets (Dry Run):")
-        for _, bet in value_bets.iterrows():
-            bet_data = {
-                "market_id": bet["match_id"],
-                "selection": f"{bet['home_team']} vs {bet['away_team']} - {bet['market']}",
-                "stake": bet["stake"],
-                "odds": bet["odds"],
-                "confidence": bet["p_win"],
-                "edge": bet.get("edge", 0.0),
-            }
+        bet_rows = value_bets.reindex(
+            columns=[
+                "match_id",
+                "home_team",
+                "away_team",
+                "market",
+                "stake",
+                "odds",
+                "p_win",
+                "edge",
+            ],
+            fill_value=0.0,
+        )
+        rows = list(bet_rows.itertuples(index=False, name=None))
+        results = executor.execute_many(
+            [
+                {
+                    "market_id": match_id,
+                    "selection": f"{home} vs {away} - {market}",
+                    "stake": stake,
+                    "odds": odds,
+                    "confidence": p_win,
+                    "edge": edge,
+                }
+                for match_id, home, away, market, stake, odds, p_win, edge in rows
+            ],
+            dry_run=True,
+        )
 
-            result = executor.execute(bet_data, dry_run=True)
+        for (_, home, _, _, stake, odds, _, _), result in zip(rows, results):
             if result.get("status") in ["accepted", "simulated", "dry_run"]:
                 executed_count += 1
-                print(f"   ✅ {bet['home_team']} - ${bet['stake']:.2f} @ {bet['odds']}")
+                print(f"   ✅ {home} - ${stake:.2f} @ {odds}")
 
         print("\n5️⃣  Execution Summary:")
         print(f"   Total: {len(value_bets)} bets")
@@ -417,7 +446,11 @@ def test_8_end_to_end_workflow():
 
         # 6. Check database
         with handle_db_errors() as session:
-            recent_bets = session.query(BetRecord).filter(BetRecord.market_id.like("E2E_%")).count()
+            recent_bets = (
+                session.query(BetRecord)
+                .filter(BetRecord.market_id.in_(opportunities["match_id"].tolist()))
+                .count()
+            )
             print(f"\n6️⃣  Database Check: {recent_bets} bets persisted")
 
         print("\n✅ End-to-end workflow completed successfully!")
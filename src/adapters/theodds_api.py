@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import atexit
 import inspect
 import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 
 try:  # pragma: no cover - used only in test environments
@@ -25,6 +27,13 @@ API_KEY = os.getenv("THEODDS_API_KEY")
 BASE_URL = os.getenv("THEODDS_API_BASE", "https://api.the-odds-api.com/v4")
 HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", "10"))
 
+# Keep-alive connection pool shared by every API call so repeated requests (one per
+# sport per tracker tick) reuse TCP/TLS connections. Retries stay with the tenacity
+# decorator on _get rather than a urllib3 Retry, so failures are not retried twice.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+atexit.register(_SESSION.close)
+
 
 @with_circuit_breaker(name="theodds_api", fallback_value=[], use_cache=False)
 @retry(wait=wait_exponential(multiplier=1, min=1, max=4), stop=stop_after_attempt(3))
@@ -33,7 +42,7 @@ def _get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
     if API_KEY:
         params.setdefault("apiKey", API_KEY)
 
-    response = requests.get(
+    response = _SESSION.get(
         f"{BASE_URL}{path}",
         params=params,
         timeout=HTTP_TIMEOUT,
@@ -412,33 +412,34 @@ class MarketRegimeDetector:
         if not isinstance(volume, pd.Series):
             volume = pd.Series(volume)
 
-        obv = pd.Series(index=prices.index, dtype=float)
-        obv.iloc[0] = volume.iloc[0] if len(volume) > 0 else 0
-
-        for i in range(1, len(prices)):
-            if prices.iloc[i] > prices.iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] + volume.iloc[i]
-            elif prices.iloc[i] < prices.iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] - volume.iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i - 1]
+        if len(prices) == 0:
+            return pd.Series(index=prices.index, dtype=float)
+
+        # Signed volume per step (+ on up-move, - on down-move, 0 when flat), accumulated
+        # from the first bar's volume in a single cumulative sum.
+        direction = np.sign(np.nan_to_num(np.diff(prices.to_numpy(dtype=float)), nan=0.0))
+        vol = volume.to_numpy(dtype=float)[: len(prices)]
+
+        obv = np.empty(len(prices), dtype=float)
+        obv[0] = vol[0] if len(vol) > 0 else 0
+        obv[1:] = obv[0] + np.cumsum(direction * vol[1:])
 
-        return obv
+        return pd.Series(obv, index=prices.index)
 
 
 # Example usage
 if __name__ == "__main__":
     # Generate sample price data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_periods = 1000
     dates = pd.date_range(start="2020-01-01", periods=n_periods, freq="D")
 
     # Create different market regimes
-    trend_up = np.cumsum(np.random.normal(0.001, 0.01, 200)) + 100
-    trend_down = np.cumsum(np.random.normal(-0.0005, 0.008, 200)) + trend_up[-1]
-    volatile = np.cumsum(np.random.normal(0.0001, 0.02, 200)) + trend_down[-1]
-    ranging = np.cumsum(np.random.normal(0.0001, 0.005, 200)) + volatile[-1]
-    crash = np.cumsum(np.random.normal(-0.005, 0.03, 200)) + ranging[-1]
+    trend_up = np.cumsum(rng.normal(0.001, 0.01, 200)) + 100
+    trend_down = np.cumsum(rng.normal(-0.0005, 0.008, 200)) + trend_up[-1]
+    volatile = np.cumsum(rng.normal(0.0001, 0.02, 200)) + trend_down[-1]
+    ranging = np.cumsum(rng.normal(0.0001, 0.005, 200)) + volatile[-1]
+    crash = np.cumsum(rng.normal(-0.005, 0.03, 200)) + ranging[-1]
 
     # Combine all regimes
     prices = pd.Series(
@@ -446,7 +447,7 @@ if __name__ == "__main__":
     )
 
     # Add some noise
-    prices += np.random.normal(0, 0.1, len(prices))
+    prices += rng.normal(0, 0.1, len(prices))
 
     # Initialize and fit the detector
     detector = MarketRegimeDetector(n_regimes=5)
@@ -459,15 +460,20 @@ if __name__ == "__main__":
     print("\nDetected Regimes:")
     print(results["regime"].value_counts())
 
-    # Plot results
+    # Plot results (headless sessions render off-screen instead of blocking on a GUI)
+    import os
+
+    import matplotlib
+
+    if not os.environ.get("DISPLAY"):
+        matplotlib.use("Agg")
     import matplotlib.pyplot as plt
 
     plt.figure(figsize=(14, 8))
 
-    # Plot price and regimes
-    for regime in results["regime"].unique():
-        mask = results["regime"] == regime
-        plt.plot(prices.index[mask], prices[mask], ".", label=regime, alpha=0.6)
+    # Plot price and regimes, partitioning the series once rather than masking per regime
+    for regime, regime_prices in prices.groupby(results["regime"].to_numpy()):
+        plt.plot(regime_prices.index, regime_prices.values, ".", label=regime, alpha=0.6)
 
     plt.title("Market Regime Detection")
     plt.xlabel("Date")
@@ -475,4 +481,9 @@ if __name__ == "__main__":
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+
+    if matplotlib.get_backend().lower() == "agg":
+        plt.savefig("market_regimes.png", bbox_inches="tight")
+        print("\nSaved plot to market_regimes.png")
+    else:
+        plt.show()
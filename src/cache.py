@@ -3,7 +3,7 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Union
 
 import pandas as pd
-from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text, func
 
 from src.db import Base, handle_db_errors
 from src.config import settings
@@ -269,33 +269,40 @@ class DataCache:
         """Get cache statistics.
 
         Returns:
-            Dictionary with cache stats
+            Dictionary with cache stats; timestamps are timezone-aware UTC
         """
         with handle_db_errors() as session:
-            fixtures_count = session.query(CachedFixture).count()
-            odds_count = session.query(CachedOdds).count()
-
-            # Get oldest and newest
-            oldest_fixture = session.query(CachedFixture).order_by(CachedFixture.fetched_at).first()
-            newest_fixture = (
-                session.query(CachedFixture).order_by(CachedFixture.fetched_at.desc()).first()
-            )
-
-            oldest_odds = session.query(CachedOdds).order_by(CachedOdds.fetched_at).first()
-            newest_odds = session.query(CachedOdds).order_by(CachedOdds.fetched_at.desc()).first()
+            # One aggregate query per table instead of a count plus two ordered scans
+            fixtures_count, fixtures_oldest, fixtures_newest = session.query(
+                func.count(CachedFixture.id),
+                func.min(CachedFixture.fetched_at),
+                func.max(CachedFixture.fetched_at),
+            ).one()
+            odds_count, odds_oldest, odds_newest = session.query(
+                func.count(CachedOdds.id),
+                func.min(CachedOdds.fetched_at),
+                func.max(CachedOdds.fetched_at),
+            ).one()
 
             stats = {
                 "fixtures_count": fixtures_count,
                 "odds_count": odds_count,
-                "fixtures_oldest": oldest_fixture.fetched_at if oldest_fixture else None,
-                "fixtures_newest": newest_fixture.fetched_at if newest_fixture else None,
-                "odds_oldest": oldest_odds.fetched_at if oldest_odds else None,
-                "odds_newest": newest_odds.fetched_at if newest_odds else None,
+                "fixtures_oldest": _as_utc(fixtures_oldest),
+                "fixtures_newest": _as_utc(fixtures_newest),
+                "odds_oldest": _as_utc(odds_oldest),
+                "odds_newest": _as_utc(odds_newest),
             }
 
             return stats
 
 
+def _as_utc(ts: Optional[datetime]) -> Optional[datetime]:
+    """Return ``ts`` as an aware UTC datetime (SQLite drops tzinfo on read)."""
+    if ts is None or ts.tzinfo is not None:
+        return ts
+    return ts.replace(tzinfo=timezone.utc)
+
+
 def get_cached_odds(cache_key: Union[List[str], str, None]) -> Optional[list]:
     """Module-level helper for circuit breaker fallback to cached odds.
 
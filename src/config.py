@@ -167,6 +167,7 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = Field(default=30, ge=5, le=300, description="Timeout waiting for connection (seconds)")
     DB_POOL_RECYCLE: int = Field(default=3600, ge=300, le=86400, description="Recycle connections after this many seconds")
     DB_CONNECT_TIMEOUT: int = Field(default=15, ge=5, le=60, description="SQLite-specific connection timeout")
+    DB_QUERY_CACHE_SIZE: int = Field(default=1200, ge=0, le=10000, description="Compiled SQL statement cache entries (0 disables)")
 
     @field_validator("ENV")
     @classmethod
@@ -10,6 +10,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     Float,
+    Index,
     Integer,
     String,
     case,
@@ -115,6 +116,7 @@ engine = create_engine(
     pool_timeout=settings.DB_POOL_TIMEOUT,  # Timeout waiting for connection (seconds)
     pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle connections periodically
     pool_pre_ping=True,  # Verify connections before use
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Reuse compiled SQL across sessions
     connect_args={
         "timeout": settings.DB_CONNECT_TIMEOUT,  # SQLite-specific timeout
     }
@@ -174,8 +176,11 @@ class StrategyPerformance(Base):
     __tablename__ = "strategy_performance"
 
     id = Column(Integer, primary_key=True, index=True)
-    strategy_name = Column(String, index=True, nullable=False)
-    period_start = Column(DateTime, nullable=False, index=True)
+    # strategy_name and period_start lookups are served by the composite indexes in
+    # __table_args__ (created by migration 0002, with the old single-column indexes
+    # dropped by 0003), so they carry no index of their own
+    strategy_name = Column(String, nullable=False)
+    period_start = Column(DateTime, nullable=False)
     period_end = Column(DateTime, nullable=False, index=True)
 
     total_bets = Column(Integer, default=0)
@@ -196,7 +201,13 @@ class StrategyPerformance(Base):
     created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
 
-    __table_args__ = ({"sqlite_autoincrement": True},)
+    __table_args__ = (
+        Index("idx_strategy_performance_period", "period_start", "period_end"),
+        Index(
+            "idx_strategy_performance_name_period", "strategy_name", "period_start", "period_end"
+        ),
+        {"sqlite_autoincrement": True},
+    )
 
 
 class DailyStats(Base):
@@ -242,8 +253,7 @@ def init_db():
     Base.metadata.create_all(bind=engine)
 
 
-@db_retry(retry_on=(SQLAlchemyError, OperationalError))
-def save_bet(
+def build_bet_record(
     market_id: str,
     selection: str,
     stake: float,
@@ -254,8 +264,14 @@ def save_bet(
     strategy_name: Optional[str] = None,
     strategy_params: Optional[dict] = None,
 ) -> BetRecord:
-    """Save a bet to the database with idempotency check and retry logic."""
+    """Validate bet inputs and build an unsaved BetRecord.
+
+    Shared by ``save_bet`` and batched inserts so every path applies the same
+    validation and resolves strategy info from ``meta`` the same way.
 
+    Raises:
+        ValueError: If any input is invalid
+    """
     # Input validation
     if not isinstance(market_id, str) or not market_id.strip():
         raise ValueError("market_id must be a non-empty string")
@@ -270,6 +286,80 @@ def save_bet(
     if idempotency_key is not None and not isinstance(idempotency_key, str):
         raise ValueError("idempotency_key must be a string or None")
 
+    # Extract strategy info from meta if needed
+    if meta and "strategy" in meta and not strategy_name:
+        strategy_name = meta.get("strategy")
+        if isinstance(strategy_name, dict):
+            strategy_name = strategy_name.get("name")
+
+    if meta and "strategy_params" in meta and not strategy_params:
+        strategy_params = meta.get("strategy_params")
+        if isinstance(strategy_params, str):
+            import json
+
+            try:
+                strategy_params = json.loads(strategy_params)
+            except json.JSONDecodeError:
+                strategy_params = None
+
+    return BetRecord(
+        market_id=market_id,
+        selection=selection,
+        stake=float(stake),
+        odds=float(odds),
+        idempotency_key=idempotency_key,
+        is_dry_run=is_dry_run,
+        strategy_name=strategy_name,
+        strategy_params=strategy_params,
+        meta=meta,
+    )
+
+
+def detach_bet_record(bet: BetRecord) -> BetRecord:
+    """Copy a session-bound BetRecord into a detached instance."""
+    return BetRecord(
+        id=bet.id,
+        market_id=bet.market_id,
+        selection=bet.selection,
+        stake=bet.stake,
+        odds=bet.odds,
+        result=bet.result,
+        profit_loss=bet.profit_loss,
+        placed_at=bet.placed_at,
+        settled_at=bet.settled_at,
+        idempotency_key=bet.idempotency_key,
+        is_dry_run=bet.is_dry_run,
+        strategy_name=bet.strategy_name,
+        strategy_params=bet.strategy_params,
+        meta=bet.meta,
+    )
+
+
+@db_retry(retry_on=(SQLAlchemyError, OperationalError))
+def save_bet(
+    market_id: str,
+    selection: str,
+    stake: float,
+    odds: float,
+    idempotency_key: Optional[str] = None,
+    is_dry_run: bool = True,
+    meta: Optional[dict] = None,
+    strategy_name: Optional[str] = None,
+    strategy_params: Optional[dict] = None,
+) -> BetRecord:
+    """Save a bet to the database with idempotency check and retry logic."""
+    bet = build_bet_record(
+        market_id=market_id,
+        selection=selection,
+        stake=stake,
+        odds=odds,
+        idempotency_key=idempotency_key,
+        is_dry_run=is_dry_run,
+        meta=meta,
+        strategy_name=strategy_name,
+        strategy_params=strategy_params,
+    )
+
     with handle_db_errors() as session:
         # Check for existing bet with same idempotency key
         if idempotency_key:
@@ -281,77 +371,14 @@ def save_bet(
 
             if existing_bet:
                 logger.info("Found existing bet with idempotency key: %s", idempotency_key)
-                detached_existing = BetRecord(
-                    id=existing_bet.id,
-                    market_id=existing_bet.market_id,
-                    selection=existing_bet.selection,
-                    stake=existing_bet.stake,
-                    odds=existing_bet.odds,
-                    result=existing_bet.result,
-                    profit_loss=existing_bet.profit_loss,
-                    placed_at=existing_bet.placed_at,
-                    settled_at=existing_bet.settled_at,
-                    idempotency_key=existing_bet.idempotency_key,
-                    is_dry_run=existing_bet.is_dry_run,
-                    strategy_name=existing_bet.strategy_name,
-                    strategy_params=existing_bet.strategy_params,
-                    meta=existing_bet.meta,
-                )
-                return detached_existing
-
-        # Extract strategy info from meta if needed
-        if meta and "strategy" in meta and not strategy_name:
-            strategy_name = meta.get("strategy")
-            if isinstance(strategy_name, dict):
-                strategy_name = strategy_name.get("name")
-
-        if meta and "strategy_params" in meta and not strategy_params:
-            strategy_params = meta.get("strategy_params")
-            if isinstance(strategy_params, str):
-                import json
-
-                try:
-                    strategy_params = json.loads(strategy_params)
-                except json.JSONDecodeError:
-                    strategy_params = None
-
-        # Create new bet record
-        bet = BetRecord(
-            market_id=market_id,
-            selection=selection,
-            stake=float(stake),
-            odds=float(odds),
-            idempotency_key=idempotency_key,
-            is_dry_run=is_dry_run,
-            strategy_name=strategy_name,
-            strategy_params=strategy_params,
-            meta=meta,
-        )
+                return detach_bet_record(existing_bet)
 
         session.add(bet)
         session.flush()
         session.refresh(bet)
 
-        # Create detached copy
-        detached_bet = BetRecord(
-            id=bet.id,
-            market_id=bet.market_id,
-            selection=bet.selection,
-            stake=bet.stake,
-            odds=bet.odds,
-            result=bet.result,
-            profit_loss=bet.profit_loss,
-            placed_at=bet.placed_at,
-            settled_at=bet.settled_at,
-            idempotency_key=bet.idempotency_key,
-            is_dry_run=bet.is_dry_run,
-            strategy_name=bet.strategy_name,
-            strategy_params=bet.strategy_params,
-            meta=bet.meta,
-        )
-
         logger.debug("Created new bet with ID: %s", bet.id)
-        return detached_bet
+        return detach_bet_record(bet)
 
 
 @db_retry(retry_on=(SQLAlchemyError, OperationalError))
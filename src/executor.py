@@ -17,6 +17,7 @@ from typing import Any, Dict, Optional
 from src.config import settings
 from src.db import (
     BetRecord,
+    build_bet_record,
     get_daily_loss,
     get_open_bets_count,
     handle_db_errors,
@@ -445,6 +446,142 @@ class Executor:
 
         return results
 
+    def execute_many(
+        self, bets: list[Dict[str, Any]], dry_run: Optional[bool] = None
+    ) -> list[Dict[str, Any]]:
+        """Record many dry-run bets with a single database transaction.
+
+        Validation and risk checks run per bet as in ``execute``, but the risk
+        state is read once for the whole batch and all accepted bets are inserted
+        and committed together. LIVE bets still need one bookmaker call each, so
+        they are delegated to ``execute_batch``.
+
+        Args:
+            bets: List of bet dictionaries
+            dry_run: Override mode (None = use settings.MODE)
+
+        Returns:
+            List of execution results, in the same order as ``bets``
+        """
+        if dry_run is None:
+            dry_run = settings.MODE != "LIVE"
+
+        if not dry_run:
+            return self.execute_batch(bets, dry_run=False)
+
+        start_time = time.time()
+        init_db()
+
+        logger.info(f"Recording batch of {len(bets)} dry-run bets")
+
+        open_bets = get_open_bets_count(exclude_dry_run=True)
+        daily_loss = get_daily_loss()
+
+        results: list[Optional[Dict[str, Any]]] = [None] * len(bets)
+        pending: list[tuple[int, str, BetRecord]] = []
+
+        for i, bet in enumerate(bets):
+            if not self._validate_bet(bet):
+                results[i] = {
+                    "status": "rejected",
+                    "reason": "Invalid bet parameters",
+                    "message": "Invalid bet parameters",
+                    "dry_run": True,
+                }
+                continue
+
+            risk_meta = dict(bet)
+            risk_meta["dry_run"] = True
+            risk_check = check_risk_limits(
+                stake=bet["stake"],
+                bankroll=bet.get("bankroll", 10000.0),
+                open_bets_count=open_bets,
+                daily_loss=daily_loss,
+                bet_meta=risk_meta,
+            )
+
+            if not risk_check["allowed"]:
+                logger.warning(f"Bet rejected by risk management: {risk_check['reason']}")
+                results[i] = {
+                    "status": "rejected",
+                    "reason": risk_check["reason"],
+                    "message": risk_check["reason"],
+                    "dry_run": True,
+                }
+                continue
+
+            self._check_rate_limit()
+            idempotency_key = self._generate_idempotency_key(bet)
+
+            meta_payload = {
+                "status": BetStatus.PENDING.value,
+                "submitted_at": datetime.now(timezone.utc).isoformat(),
+            }
+            meta_payload.update({k: v for k, v in bet.items() if k != "meta"})
+            if bet.get("meta"):
+                meta_payload.update(bet.get("meta", {}))
+
+            try:
+                # Same validation and strategy resolution as save_bet (used by execute)
+                record = build_bet_record(
+                    market_id=bet["market_id"],
+                    selection=bet["selection"],
+                    stake=bet["stake"],
+                    odds=bet["odds"],
+                    idempotency_key=idempotency_key,
+                    is_dry_run=True,
+                    meta=meta_payload,
+                    strategy_name=bet.get("strategy_name"),
+                    strategy_params=bet.get("strategy_params"),
+                )
+            except ValueError as exc:
+                logger.error(f"Failed to persist bet: {exc}", exc_info=True)
+                results[i] = {"status": "error", "db_error": str(exc), "dry_run": True}
+                continue
+            pending.append((i, idempotency_key, record))
+
+        if pending:
+            try:
+                with handle_db_errors() as session:
+                    # Idempotency: reuse rows already stored under the same keys, as
+                    # save_bet does, with one lookup for the whole batch
+                    existing = dict(
+                        session.query(BetRecord.idempotency_key, BetRecord.id)
+                        .filter(BetRecord.idempotency_key.in_([key for _, key, _ in pending]))
+                        .all()
+                    )
+                    new_records = {}
+                    for _, key, record in pending:
+                        if key not in existing and key not in new_records:
+                            new_records[key] = record
+                    session.add_all(new_records.values())
+                    session.flush()
+                    existing.update((key, record.id) for key, record in new_records.items())
+                    db_ids = [existing[key] for _, key, _ in pending]
+            except Exception as exc:
+                logger.error(f"Failed to persist bet batch: {exc}", exc_info=True)
+                for i, _, _ in pending:
+                    results[i] = {"status": "error", "db_error": str(exc), "dry_run": True}
+                return results
+
+            execution_time = time.time() - start_time
+            for (i, idempotency_key, _), db_id in zip(pending, db_ids):
+                results[i] = {
+                    "status": "dry_run",
+                    "db_id": db_id,
+                    "message": "Bet recorded in database (dry-run mode)",
+                    "execution_time": execution_time,
+                    "dry_run": True,
+                    "idempotency_key": idempotency_key,
+                }
+
+        logger.info(
+            f"Dry-run batch complete: {len(pending)} recorded, "
+            f"{len(bets) - len(pending)} rejected (time: {time.time() - start_time:.2f}s)"
+        )
+
+        return results
+
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get executor statistics.
 
@@ -54,12 +54,12 @@ def build_features(fixtures_df: pd.DataFrame, odds_df: pd.DataFrame) -> pd.DataF
             
             odds_mapped["selection_norm"] = np.select(conditions, choices, default=np.nan)
             
-            # Filter out unmapped selections
-            odds_filtered = odds_mapped.dropna(subset=["selection_norm"]).copy()
-            odds_filtered["selection"] = odds_filtered["selection_norm"]
-            
-            # Clean up
-            odds_filtered = odds_filtered.drop(columns=["home", "away", "selection_norm"])
+            # Filter out unmapped selections and swap in the normalized selection
+            odds_filtered = (
+                odds_mapped.dropna(subset=["selection_norm"])
+                .drop(columns=["selection", "home", "away"])
+                .rename(columns={"selection_norm": "selection"})
+            )
         else:
             # Fallback if home/away columns missing (shouldn't happen)
             odds_filtered = odds_df[odds_df["selection"].isin(standard_selections)].copy()
@@ -71,10 +71,14 @@ def build_features(fixtures_df: pd.DataFrame, odds_df: pd.DataFrame) -> pd.DataF
             # Drop rows where odds couldn't be converted
             odds_filtered = odds_filtered.dropna(subset=["odds"])
 
-            # Pivot odds
-            odds_pivot = odds_filtered.pivot_table(
-                index="market_id", columns="selection", values="odds", aggfunc="first"
-            ).reset_index()
+            # Pivot odds (first quote per market/selection, without pivot_table overhead)
+            odds_pivot = (
+                odds_filtered.groupby(["market_id", "selection"], sort=False)["odds"]
+                .first()
+                .unstack("selection")
+                .sort_index(axis=1)
+                .reset_index()
+            )
             
             # Rename columns
             rename_map = {}
@@ -295,6 +299,9 @@ def select_features(df: pd.DataFrame, feature_names: Optional[List[str]] = None)
             core_features.insert(1, away_col)
             break
 
+    # Numeric columns are resolved once and reused by the fallback and final filter
+    numeric_cols = set(df.select_dtypes(include=[np.number]).columns)
+
     # Find available features
     available = [f for f in core_features if f in df.columns]
 
@@ -316,12 +323,10 @@ def select_features(df: pd.DataFrame, feature_names: Optional[List[str]] = None)
             "odds_differential",
             "odds_ratio",
         ]
-        numeric_df = df.select_dtypes(include=[np.number])
-        available = [c for c in numeric_df.columns if c not in exclude_cols]
+        available = [c for c in df.columns if c in numeric_cols and c not in exclude_cols]
 
     # CRITICAL FIX: Ensure only numeric data, handle inf/nan
-    result = df[available].copy()
-    result = result.select_dtypes(include=[np.number])
+    result = df[[c for c in available if c in numeric_cols]]
 
     # Replace inf with nan, then fill
     result = result.replace([np.inf, -np.inf], np.nan)
@@ -90,7 +90,7 @@ def cmd_train(args):
         model = ModelWrapper()
         labels = features["label"].values
         features_only = features.drop(columns=["label", "market_id"], errors="ignore")
-        X = features_only.select_dtypes(include=["number"]).fillna(0).values
+        X = features_only.select_dtypes(include=["number"]).fillna(0)
         model.train(X, labels)
         logger.info("Simple model trained")
 
@@ -11,7 +11,7 @@ from src.data_fetcher import DataFetcher
 from src.adapters.theodds_api import TheOddsAPIAdapter
 from src.config import settings
 from src.social.ml_predictor import get_predictor
-from src.social.aggregator import get_match_sentiment
+from src.social.aggregator import get_cached_match_sentiment
 from src.arbitrage_detector import ArbitrageDetector
 
 logger = get_logger(__name__)
@@ -114,8 +114,9 @@ class RealtimeMarketIngestor:
         Returns:
             Enriched fixtures with ML predictions
         """
-        enriched = []
-        
+        # Gather every fixture's ML input first so the model is called once
+        prepared = []
+        ml_inputs = []
         for fixture in fixtures:
             try:
                 # Extract odds
@@ -124,11 +125,11 @@ class RealtimeMarketIngestor:
                 draw_odds = fixture.get('draw_odds', 3.0)
                 
                 # Get sentiment if available
-                sentiment = get_match_sentiment(fixture.get('id', ''))
+                sentiment = get_cached_match_sentiment(fixture.get('id', ''))
                 sentiment_score = sentiment.get('aggregate_score', 0.0) if sentiment else 0.0
                 
                 # Prepare ML input
-                ml_input = {
+                ml_inputs.append({
                     'sentiment_score': sentiment_score,
                     'positive_pct': sentiment.get('positive_pct', 33.0) if sentiment else 33.0,
                     'negative_pct': sentiment.get('negative_pct', 33.0) if sentiment else 33.0,
@@ -137,11 +138,27 @@ class RealtimeMarketIngestor:
                     'home_odds': home_odds,
                     'away_odds': away_odds,
                     'draw_odds': draw_odds,
-                }
-                
-                # Get ML prediction
-                prediction = self.ml_predictor.predict(ml_input)
+                })
+                prepared.append((fixture, sentiment, sentiment_score))
                 
+            except Exception as e:
+                logger.error(f"Error enriching fixture {fixture.get('id')}: {e}")
+                continue
+        
+        # Get ML predictions for all fixtures in one batched model call
+        try:
+            predictions = self.ml_predictor.predict_batch(ml_inputs)
+        except Exception as e:
+            logger.error(f"Error predicting fixtures in one batch, retrying per fixture: {e}")
+            predictions = self._predict_each(prepared, ml_inputs)
+        
+        enriched = []
+        for (fixture, sentiment, sentiment_score), ml_input, prediction in zip(
+            prepared, ml_inputs, predictions
+        ):
+            if prediction is None:
+                continue
+            try:
                 # Add ML data to fixture
                 fixture['ml_home_prob'] = prediction['probabilities'].get('home', 0.33)
                 fixture['ml_away_prob'] = prediction['probabilities'].get('away', 0.33)
@@ -152,11 +169,11 @@ class RealtimeMarketIngestor:
                 # Calculate EV
                 predicted_prob = prediction['probabilities'][prediction['predicted_outcome']]
                 if prediction['predicted_outcome'] == 'home':
-                    odds = home_odds
+                    odds = ml_input['home_odds']
                 elif prediction['predicted_outcome'] == 'away':
-                    odds = away_odds
+                    odds = ml_input['away_odds']
                 else:
-                    odds = draw_odds
+                    odds = ml_input['draw_odds']
                 
                 fixture['ev_score'] = (predicted_prob * odds) - 1
                 fixture['sentiment_score'] = sentiment_score
@@ -171,6 +188,23 @@ class RealtimeMarketIngestor:
         logger.info(f"Enriched {len(enriched)} fixtures with ML predictions")
         return enriched
     
+    def _predict_each(
+        self, prepared: List[tuple], ml_inputs: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Predict fixtures one at a time after a failed batch call.
+        
+        Returns one prediction per ML input, with ``None`` for fixtures that
+        still fail so only those are skipped.
+        """
+        predictions = []
+        for (fixture, _, _), ml_input in zip(prepared, ml_inputs):
+            try:
+                predictions.append(self.ml_predictor.predict(ml_input))
+            except Exception as e:
+                logger.error(f"Error predicting fixture {fixture.get('id')}: {e}")
+                predictions.append(None)
+        return predictions
+    
     def detect_arbitrage(self, fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Detect arbitrage opportunities in fixtures.
         
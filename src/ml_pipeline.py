@@ -12,6 +12,13 @@ from sklearn.model_selection import TimeSeriesSplit
 
 from src.logging_config import get_logger
 
+try:
+    import zstandard as zstd
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 MODEL_DIR = Path("./models")
@@ -24,6 +31,53 @@ OPTUNA_STORAGE_PATH = DATA_DIR / "optuna.db"
 OPTUNA_STORAGE_URL = f"sqlite:///{OPTUNA_STORAGE_PATH}"
 OPTUNA_STUDY_NAME = "model_tuning"
 
+ZSTD_LEVEL = 10
+
+
+def save_booster(booster: lgb.Booster, path: Path) -> Path:
+    """Save a Booster in LightGBM's native text format.
+
+    The text model is zstd-compressed when ``zstandard`` is installed and
+    written uncompressed otherwise.
+
+    Args:
+        booster: Trained LightGBM Booster
+        path: Destination path without extension
+
+    Returns:
+        Path of the written file (``.txt.zst`` or ``.txt``)
+    """
+    path = Path(path)
+    model_str = booster.model_to_string()
+
+    if ZSTD_AVAILABLE:
+        save_path = path.with_name(f"{path.name}.txt.zst")
+        save_path.write_bytes(zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(model_str.encode()))
+    else:
+        save_path = path.with_name(f"{path.name}.txt")
+        save_path.write_text(model_str)
+
+    logger.info(f"Booster saved to {save_path}")
+    return save_path
+
+
+def load_booster(path: Path) -> lgb.Booster:
+    """Load a Booster written by :func:`save_booster`.
+
+    Args:
+        path: Path to a ``.txt.zst`` or ``.txt`` model file
+
+    Returns:
+        Loaded LightGBM Booster
+    """
+    path = Path(path)
+    if path.suffix == ".zst":
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard not installed. Install with: pip install zstandard")
+        model_str = zstd.ZstdDecompressor().decompress(path.read_bytes()).decode()
+        return lgb.Booster(model_str=model_str)
+    return lgb.Booster(model_file=str(path))
+
 
 class MLPipeline:
     """Advanced ML pipeline with time-series cross-validation and hyperparameter tuning."""
@@ -60,7 +114,12 @@ class MLPipeline:
         return X
 
     def train_with_cv(
-        self, df: pd.DataFrame, labels: np.ndarray, n_splits: int = 5, n_trials: int = 40
+        self,
+        df: pd.DataFrame,
+        labels: np.ndarray,
+        n_splits: int = 5,
+        n_trials: int = 40,
+        n_jobs: int = 1,
     ) -> lgb.Booster:
         """Train model with time-series cross-validation and hyperparameter tuning.
 
@@ -69,13 +128,28 @@ class MLPipeline:
             labels: Target labels
             n_splits: Number of cross-validation splits
             n_trials: Number of Optuna trials
+            n_jobs: Number of trials to run concurrently (-1 uses all cores)
 
         Returns:
             Trained LightGBM model
         """
         X = self._prepare(df)
-
-        logger.info(f"Starting hyperparameter tuning with {n_trials} trials")
+        X_values = np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+        labels = np.asarray(labels)
+        folds = list(TimeSeriesSplit(n_splits=n_splits).split(X_values))
+
+        # Bin the features once; every fold of every trial takes a subset of this Dataset
+        # and reuses its bin boundaries instead of re-binning the raw data. Pre-filtering
+        # is disabled so trials may vary min_data_in_leaf on the shared bins.
+        full_data = lgb.Dataset(
+            X_values,
+            label=labels,
+            feature_name=list(X.columns),
+            params={"feature_pre_filter": False, "verbosity": -1},
+            free_raw_data=False,
+        ).construct()
+
+        logger.info(f"Starting hyperparameter tuning with {n_trials} trials (n_jobs={n_jobs})")
 
         def objective(trial: optuna.Trial) -> float:
             """Optuna objective function."""
@@ -88,6 +162,8 @@ class MLPipeline:
                 "num_class": n_classes if is_multiclass else 1,
                 "verbosity": -1,
                 "boosting_type": "gbdt",
+                # Concurrent trials each get one thread to avoid oversubscribing cores
+                "num_threads": 1 if n_jobs != 1 else 0,
                 "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.2, log=True),
                 "num_leaves": trial.suggest_int("num_leaves", 16, 256),
                 "min_data_in_leaf": trial.suggest_int("min_data_in_leaf", 5, 50),
@@ -99,17 +175,13 @@ class MLPipeline:
             }
 
             # Time-series cross-validation
-            tscv = TimeSeriesSplit(n_splits=n_splits)
             losses = []
 
-            for train_idx, val_idx in tscv.split(X):
-                X_train = X.iloc[train_idx]
-                y_train = labels[train_idx]
-                X_val = X.iloc[val_idx]
+            for train_idx, val_idx in folds:
                 y_val = labels[val_idx]
 
-                dtrain = lgb.Dataset(X_train, label=y_train)
-                dval = lgb.Dataset(X_val, label=y_val)
+                dtrain = full_data.subset(train_idx)
+                dval = full_data.subset(val_idx)
 
                 bst = lgb.train(
                     params,
@@ -121,21 +193,33 @@ class MLPipeline:
                     ],
                 )
 
-                preds = bst.predict(X_val)
+                preds = bst.predict(X_values[val_idx])
                 loss = log_loss(y_val, preds)
                 losses.append(loss)
 
             # Optuna study is configured to maximize, so negate the loss
             return -np.mean(losses)
 
-        # Run Optuna optimization with persistent storage to accumulate trials over time
+        # Run Optuna optimization with persistent storage to accumulate trials over time.
+        # The SQLite busy timeout lets concurrent trials (and separate --tune-only worker
+        # processes sharing data/optuna.db) wait for the write lock instead of failing.
+        storage = optuna.storages.RDBStorage(
+            url=OPTUNA_STORAGE_URL,
+            engine_kwargs={"connect_args": {"timeout": 30}},
+        )
         study = optuna.create_study(
             study_name=OPTUNA_STUDY_NAME,
             direction="maximize",
-            storage=OPTUNA_STORAGE_URL,
+            storage=storage,
             load_if_exists=True,
         )
-        study.optimize(objective, n_trials=n_trials, show_progress_bar=True)
+        study.optimize(
+            objective,
+            n_trials=n_trials,
+            n_jobs=n_jobs,
+            gc_after_trial=n_jobs != 1,
+            show_progress_bar=True,
+        )
 
         self.best_params = study.best_params
         best_loss = -study.best_value
@@ -217,7 +301,10 @@ class MLPipeline:
         if not load_path.exists():
             raise FileNotFoundError(f"Model not found: {load_path}")
 
-        self.model = joblib.load(load_path)
+        if load_path.suffix in (".txt", ".zst"):
+            self.model = load_booster(load_path)
+        else:
+            self.model = joblib.load(load_path)
         logger.info(f"Model loaded from {load_path}")
 
     def predict_proba(self, df: pd.DataFrame) -> np.ndarray:
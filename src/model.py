@@ -2,9 +2,10 @@
 import os
 import pickle
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
+import pandas as pd
 from sklearn.base import BaseEstimator
 from sklearn.ensemble import RandomForestClassifier
 
@@ -17,6 +18,18 @@ MODEL_PATH = MODEL_DIR / "model.pkl"
 ENSEMBLE_PATH = MODEL_DIR / "ensemble"
 
 
+def _as_model_input(X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+    """Convert a feature DataFrame to a C-contiguous float32 matrix in one copy.
+
+    Tree ensembles work on float32 internally, so converting here avoids the
+    intermediate float64 ``.values`` buffer callers would otherwise build.
+    Arrays are passed through unchanged.
+    """
+    if isinstance(X, pd.DataFrame):
+        return np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+    return X
+
+
 class ModelWrapper:
     """Wrapper for sklearn-compatible models with persistence."""
 
@@ -32,14 +45,15 @@ class ModelWrapper:
         # Ensure model directory exists
         MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
-    def train(self, X: np.ndarray, y: np.ndarray, **kwargs) -> None:
+    def train(self, X: Union[np.ndarray, pd.DataFrame], y: np.ndarray, **kwargs) -> None:
         """Train a Random Forest classifier.
 
         Args:
-            X: Feature matrix (n_samples, n_features)
+            X: Feature matrix or numeric feature DataFrame (n_samples, n_features)
             y: Target vector (n_samples,)
             **kwargs: Additional parameters for RandomForestClassifier
         """
+        X = _as_model_input(X)
         logger.info(f"Training model on {X.shape[0]} samples with {X.shape[1]} features")
 
         # Default hyperparameters
@@ -106,24 +120,24 @@ class ModelWrapper:
             self.model = pickle.load(f)
         logger.info(f"Model loaded from {load_path}")
 
-    def predict(self, X: np.ndarray) -> np.ndarray:
+    def predict(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
         """Generate class predictions.
 
         Args:
-            X: Feature matrix (n_samples, n_features)
+            X: Feature matrix or numeric feature DataFrame (n_samples, n_features)
 
         Returns:
             Predicted classes (n_samples,)
         """
         if self.model is None:
             raise RuntimeError("Model not loaded")
-        return self.model.predict(X)
+        return self.model.predict(_as_model_input(X))
 
-    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+    def predict_proba(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
         """Generate probability predictions.
 
         Args:
-            X: Feature matrix (n_samples, n_features)
+            X: Feature matrix or numeric feature DataFrame (n_samples, n_features)
 
         Returns:
             Predicted probabilities (n_samples, n_classes)
@@ -131,9 +145,26 @@ class ModelWrapper:
         if self.model is None:
             raise RuntimeError("Model not loaded")
 
+        X = _as_model_input(X)
         logger.debug(f"Predicting probabilities for {X.shape[0]} samples")
         return self.model.predict_proba(X)
 
+    def predict_pos_proba(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+        """Generate positive-class probabilities.
+
+        Args:
+            X: Feature matrix or numeric feature DataFrame (n_samples, n_features)
+
+        Returns:
+            Contiguous positive-class probabilities (n_samples,)
+        """
+        proba = self.predict_proba(X)
+        if proba.ndim == 1:
+            return proba
+        # Copy out the one column callers use so the (n_samples, n_classes) matrix
+        # can be released instead of being kept alive by a strided view
+        return np.ascontiguousarray(proba[:, 1])
+
     def get_feature_importance(self) -> Optional[np.ndarray]:
         """Get feature importances if available.
 
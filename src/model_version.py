@@ -24,6 +24,8 @@ class ModelVersionManager:
         
         # Load version history
         self.versions = self._load_versions()
+        # Index for O(1) lookup by version_id; kept in sync wherever self.versions changes
+        self._by_id = {version["version_id"]: version for version in self.versions}
     
     def _load_versions(self) -> List[Dict]:
         """Load version metadata from file."""
@@ -95,6 +97,7 @@ class ModelVersionManager:
         
         # Add to version history
         self.versions.append(version_metadata)
+        self._by_id[version_id] = version_metadata
         self._save_versions()
         
         return version_id
@@ -180,6 +183,7 @@ class ModelVersionManager:
                     logger.info(f"Removed old backup: {version['version_id']}")
         
         self.versions = versions_to_keep
+        self._by_id = {version["version_id"]: version for version in versions_to_keep}
         self._save_versions()
         
         logger.info(f"Cleaned up old versions. Kept {len(versions_to_keep)} recent backups.")
@@ -193,3 +197,14 @@ class ModelVersionManager:
         if not self.versions:
             return None
         return self.versions[-1]
+    
+    def get_by_id(self, version_id: str) -> Optional[Dict]:
+        """Get version metadata by ID.
+        
+        Args:
+            version_id: Version ID to look up
+            
+        Returns:
+            Version metadata (the live entry in the history) or None
+        """
+        return self._by_id.get(version_id)
@@ -8,8 +8,11 @@ CRITICAL FIXES:
 """
 from datetime import datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+import numpy as np
+
 from src.config import settings
 from src.db import get_consecutive_losses, get_current_bankroll, get_peak_bankroll, handle_db_errors
 from src.logging_config import get_logger
@@ -17,6 +20,27 @@ from src.alerts import send_alert
 
 logger = get_logger(__name__)
 
+# The Decimal Kelly/EV/variance arithmetic is pure in its inputs and is re-evaluated for
+# the same (probability, odds) pairs on every scan and backtest replay. Only the private
+# helpers over already-converted Decimals are cached; the public functions still
+# validate and log on every call and never hand unhashable arguments to the cache.
+_RISK_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_RISK_CACHE_SIZE)
+def _kelly_terms(
+    p_dec: Decimal, odds_dec: Decimal, bank_dec: Decimal, kelly_frac_dec: Decimal
+) -> tuple:
+    """Cached Kelly edge and rounded fractional-Kelly stake for validated inputs."""
+    q = Decimal("1") - p_dec
+    edge = (p_dec * (odds_dec - Decimal("1")) - q) / (odds_dec - Decimal("1"))
+
+    if edge <= 0:
+        return edge, 0.0
+
+    optimal = (edge * kelly_frac_dec * bank_dec).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return edge, float(optimal)
+
 
 def kelly_stake(p: float, odds: float, bank: float, kelly_frac: float = 0.25) -> float:
     """Calculate optimal Kelly stake with Decimal precision.
@@ -52,20 +76,13 @@ def kelly_stake(p: float, odds: float, bank: float, kelly_frac: float = 0.25) ->
             logger.warning(f"Invalid bankroll {bank}, must be positive")
             return 0.0
 
-        # Calculate Kelly edge
-        q = Decimal("1") - p_dec
-        edge = (p_dec * (odds_dec - Decimal("1")) - q) / (odds_dec - Decimal("1"))
+        # Calculate Kelly edge and optimal stake with fractional Kelly
+        edge, result = _kelly_terms(p_dec, odds_dec, bank_dec, kelly_frac_dec)
 
         if edge <= 0:
             logger.debug(f"No edge: p={p}, odds={odds}, edge={edge}")
             return 0.0
 
-        # Calculate optimal stake with fractional Kelly
-        optimal = (edge * kelly_frac_dec * bank_dec).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-
-        result = float(optimal)
         logger.debug(
             f"Kelly stake: p={p:.3f}, odds={odds:.2f}, bank={bank:.2f}, "
             f"edge={float(edge):.4f}, stake={result:.2f}"
@@ -107,6 +124,44 @@ def kelly_fraction(win_prob: float, odds: float, bankroll: float) -> float:
     return stake_from_bankroll(win_prob, odds, bankroll, settings.DEFAULT_KELLY_FRACTION)
 
 
+def kelly_stakes(
+    win_probs: np.ndarray,
+    odds: np.ndarray,
+    bankroll: float,
+    kelly_multiplier: Optional[float] = None,
+) -> np.ndarray:
+    """Vectorized counterpart of ``stake_from_bankroll`` for many bets at once.
+
+    Applies the same validity checks, fractional Kelly sizing and bankroll caps as
+    the scalar path, but over whole arrays instead of one Decimal call per bet.
+
+    Args:
+        win_probs: Win probabilities (0-1)
+        odds: Decimal odds, same shape as ``win_probs``
+        bankroll: Current bankroll
+        kelly_multiplier: Fractional Kelly multiplier (None = configured default)
+
+    Returns:
+        Array of stakes rounded to 2 decimal places (0.0 where there is no edge)
+    """
+    p = np.asarray(win_probs, dtype=np.float64)
+    o = np.asarray(odds, dtype=np.float64)
+
+    if bankroll <= 0:
+        return np.zeros(np.broadcast(p, o).shape)
+
+    multiplier = (
+        kelly_multiplier if kelly_multiplier is not None else settings.DEFAULT_KELLY_FRACTION
+    )
+
+    valid = (p > 0) & (p < 1) & (o >= 1.01)
+    b = np.where(valid, o - 1.0, 1.0)
+    edge = np.where(valid, (p * b - (1.0 - p)) / b, 0.0)
+
+    stakes = np.round(np.maximum(edge, 0.0) * multiplier * bankroll, 2)
+    return np.minimum(stakes, min(bankroll * settings.MAX_STAKE_FRAC, bankroll))
+
+
 def check_risk_limits(
     stake: float,
     bankroll: float,
@@ -288,6 +343,18 @@ def validate_bet_parameters(
     return {"valid": len(errors) == 0, "errors": errors}
 
 
+@lru_cache(maxsize=_RISK_CACHE_SIZE)
+def _expected_value(p_dec: Decimal, odds_dec: Decimal, stake_dec: Decimal) -> float:
+    """Cached cent-rounded expected value for Decimal inputs."""
+    win_return = (odds_dec - Decimal("1")) * stake_dec
+    loss_return = -stake_dec
+
+    expected = (p_dec * win_return) + ((Decimal("1") - p_dec) * loss_return)
+    ev = expected.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+    return float(ev)
+
+
 def calculate_expected_value(probability: float, odds: float, stake: float = 1.0) -> float:
     """Calculate expected value with Decimal precision.
 
@@ -306,19 +373,28 @@ def calculate_expected_value(probability: float, odds: float, stake: float = 1.0
         odds_dec = Decimal(str(odds))
         stake_dec = Decimal(str(stake))
 
-        win_return = (odds_dec - Decimal("1")) * stake_dec
-        loss_return = -stake_dec
-
-        expected = (p_dec * win_return) + ((Decimal("1") - p_dec) * loss_return)
-        ev = expected.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-        return float(ev)
+        return _expected_value(p_dec, odds_dec, stake_dec)
 
     except (InvalidOperation, ValueError) as e:
         logger.error(f"Error calculating EV: {e}")
         return 0.0
 
 
+@lru_cache(maxsize=_RISK_CACHE_SIZE)
+def _variance(p_dec: Decimal, odds_dec: Decimal, stake_dec: Decimal) -> float:
+    """Cached variance of bet returns for Decimal inputs."""
+    win_return = (odds_dec - Decimal("1")) * stake_dec
+    loss_return = -stake_dec
+
+    mean = Decimal(str(_expected_value(p_dec, odds_dec, stake_dec)))
+
+    win_dev = win_return - mean
+    loss_dev = loss_return - mean
+
+    variance = (p_dec * (win_dev**2)) + ((Decimal("1") - p_dec) * (loss_dev**2))
+    return float(variance.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP))
+
+
 def calculate_variance(probability: float, odds: float, stake: float = 1.0) -> float:
     """Calculate variance of bet returns using Decimal arithmetic."""
 
@@ -327,18 +403,7 @@ def calculate_variance(probability: float, odds: float, stake: float = 1.0) -> f
         odds_dec = Decimal(str(odds))
         stake_dec = Decimal(str(stake))
 
-        win_return = (odds_dec - Decimal("1")) * stake_dec
-        loss_return = -stake_dec
-
-        mean = Decimal(
-            str(calculate_expected_value(probability, float(odds_dec), float(stake_dec)))
-        )
-
-        win_dev = win_return - mean
-        loss_dev = loss_return - mean
-
-        variance = (p_dec * (win_dev**2)) + ((Decimal("1") - p_dec) * (loss_dev**2))
-        return float(variance.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP))
+        return _variance(p_dec, odds_dec, stake_dec)
     except (InvalidOperation, ValueError) as exc:
         logger.error(f"Error calculating variance: {exc}")
         return 0.0
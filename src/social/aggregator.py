@@ -2,6 +2,8 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import math
+import threading
+import time
 
 from src.config import settings
 from src.logging_config import get_logger
@@ -10,6 +12,12 @@ from src.db import handle_db_errors
 
 logger = get_logger(__name__)
 
+# In-process cache of get_match_sentiment results: match_id -> (fetched_at, result)
+SENTIMENT_CACHE_TTL_SECONDS = 900
+SENTIMENT_CACHE_MAX_ENTRIES = 4096
+_sentiment_cache: Dict[str, tuple] = {}
+_sentiment_cache_lock = threading.Lock()
+
 
 def calculate_recency_weight(post_age_hours: float, decay_factor: float = 0.1) -> float:
     """Calculate recency weight for a post.
@@ -196,6 +204,7 @@ def save_sentiment_aggregate(aggregate_data: Dict) -> bool:
                 logger.debug(f"Created sentiment aggregate for {aggregate_data['match_id']}")
 
             session.commit()
+            invalidate_cached_match_sentiment(aggregate_data["match_id"])
             return True
 
     except Exception as e:
@@ -253,3 +262,38 @@ def get_match_sentiment(match_id: str) -> Optional[Dict]:
     except Exception as e:
         logger.error(f"Error getting match sentiment for {match_id}: {e}")
         return None
+
+
+def get_cached_match_sentiment(
+    match_id: str, ttl_seconds: float = SENTIMENT_CACHE_TTL_SECONDS
+) -> Optional[Dict]:
+    """Get latest sentiment aggregate for a match, reusing recent lookups.
+
+    Results (including "no aggregate") are kept for ``ttl_seconds`` so
+    repeated polling of the same fixtures doesn't re-query the database.
+    Saving a new aggregate in this process invalidates its entry.
+    """
+    now = time.monotonic()
+    with _sentiment_cache_lock:
+        entry = _sentiment_cache.get(match_id)
+    if entry is not None and now - entry[0] < ttl_seconds:
+        return entry[1]
+
+    result = get_match_sentiment(match_id)
+
+    with _sentiment_cache_lock:
+        # Re-insert so dict order tracks fetch time, then drop the oldest past the bound
+        _sentiment_cache.pop(match_id, None)
+        if len(_sentiment_cache) >= SENTIMENT_CACHE_MAX_ENTRIES:
+            _sentiment_cache.pop(next(iter(_sentiment_cache)))
+        _sentiment_cache[match_id] = (now, result)
+    return result
+
+
+def invalidate_cached_match_sentiment(match_id: Optional[str] = None) -> None:
+    """Drop one match's cached sentiment, or the whole cache when match_id is None."""
+    with _sentiment_cache_lock:
+        if match_id is None:
+            _sentiment_cache.clear()
+        else:
+            _sentiment_cache.pop(match_id, None)
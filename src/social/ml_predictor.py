@@ -20,6 +20,12 @@ MODEL_DIR = Path("./models/social")
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _get_number(match_data: Dict, key: str, default: float) -> float:
+    """Read a numeric match field, treating an explicit ``None`` as missing."""
+    value = match_data.get(key)
+    return default if value is None else value
+
+
 class SocialMLPredictor:
     """ML-powered predictor using social signals and sentiment data."""
     
@@ -38,40 +44,68 @@ class SocialMLPredictor:
         - Author influence metrics
         - Odds-based features
         - Time-based features
-        """
-        features = {}
         
-        # Sentiment features
-        features['sentiment_score'] = match_data.get('sentiment_score', 0.0)
-        features['positive_pct'] = match_data.get('positive_pct', 0.0)
-        features['negative_pct'] = match_data.get('negative_pct', 0.0)
-        features['neutral_pct'] = match_data.get('neutral_pct', 0.0)
-        features['sample_count'] = match_data.get('sample_count', 0)
-        
-        # Volume features
-        features['posts_per_hour'] = match_data.get('sample_count', 0) / 24.0
-        features['sentiment_volatility'] = abs(features['positive_pct'] - features['negative_pct'])
+        This is the single-match view of ``_feature_columns``.
+        """
+        columns = self._feature_columns([match_data])
+        return {name: float(values[0]) for name, values in columns.items()}
+    
+    def _feature_columns(self, matches: List[Dict]) -> Dict[str, np.ndarray]:
+        """Compute every ML feature as a column over many matches.
         
-        # Odds features (if available)
-        features['home_odds'] = match_data.get('home_odds', 2.0)
-        features['away_odds'] = match_data.get('away_odds', 2.0)
-        features['draw_odds'] = match_data.get('draw_odds', 3.0)
+        This is the one definition of the feature schema: ``extract_features``,
+        ``prepare_training_data`` and ``predict_batch`` all derive from it. Each
+        raw field is read once into a float array (``None`` counts as missing) and
+        the derived features are whole-column NumPy operations. Degenerate inputs
+        such as zero odds yield non-finite values rather than raising.
         
-        # Derived features
-        features['sentiment_strength'] = abs(features['sentiment_score'])
-        features['sentiment_confidence'] = max(features['positive_pct'], features['negative_pct'])
+        Args:
+            matches: List of match data dicts
+            
+        Returns:
+            Feature name -> column of values, in model feature order
+        """
+        n = len(matches)
         
-        # Symmetrical favorite flags
-        features['home_favorite'] = 1.0 if features['home_odds'] < features['away_odds'] else 0.0
-        features['away_favorite'] = 1.0 if features['away_odds'] < features['home_odds'] else 0.0
-        features['odds_spread'] = abs(features['home_odds'] - features['away_odds'])
+        def column(key, default):
+            values = (_get_number(m, key, default) for m in matches)
+            return np.fromiter(values, dtype=np.float64, count=n)
         
-        # Interaction features (Symmetric)
-        features['sentiment_x_volume'] = features['sentiment_score'] * np.log1p(features['sample_count'])
-        features['sentiment_x_home_odds'] = features['sentiment_score'] * (1.0 / features['home_odds'])
-        features['sentiment_x_away_odds'] = -features['sentiment_score'] * (1.0 / features['away_odds'])
+        # Sentiment features
+        sentiment = column('sentiment_score', 0.0)
+        positive = column('positive_pct', 0.0)
+        negative = column('negative_pct', 0.0)
+        sample_count = column('sample_count', 0)
         
-        return features
+        # Odds features (if available)
+        home_odds = column('home_odds', 2.0)
+        away_odds = column('away_odds', 2.0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'sentiment_score': sentiment,
+                'positive_pct': positive,
+                'negative_pct': negative,
+                'neutral_pct': column('neutral_pct', 0.0),
+                'sample_count': sample_count,
+                # Volume features
+                'posts_per_hour': sample_count / 24.0,
+                'sentiment_volatility': np.abs(positive - negative),
+                'home_odds': home_odds,
+                'away_odds': away_odds,
+                'draw_odds': column('draw_odds', 3.0),
+                # Derived features
+                'sentiment_strength': np.abs(sentiment),
+                'sentiment_confidence': np.maximum(positive, negative),
+                # Symmetrical favorite flags
+                'home_favorite': (home_odds < away_odds).astype(np.float64),
+                'away_favorite': (away_odds < home_odds).astype(np.float64),
+                'odds_spread': np.abs(home_odds - away_odds),
+                # Interaction features (Symmetric)
+                'sentiment_x_volume': sentiment * np.log1p(sample_count),
+                'sentiment_x_home_odds': sentiment * (1.0 / home_odds),
+                'sentiment_x_away_odds': -sentiment * (1.0 / away_odds),
+            }
     
     def prepare_training_data(self, historical_matches: List[Dict]) -> tuple:
         """Prepare training data from historical matches.
@@ -82,27 +116,20 @@ class SocialMLPredictor:
         Returns:
             X (features), y (labels)
         """
-        X_list = []
-        y_list = []
+        # Label: 0=away win, 1=draw, 2=home win
+        labels = {'away': 0, 'draw': 1, 'home': 2}
+        y_all = np.array(
+            [labels.get(match.get('outcome', 'unknown'), -1) for match in historical_matches],
+            dtype=np.int64,
+        )
         
-        for match in historical_matches:
-            features = self.extract_features(match)
-            X_list.append(list(features.values()))
-            
-            # Label: 0=away win, 1=draw, 2=home win
-            outcome = match.get('outcome', 'unknown')
-            if outcome == 'home':
-                y_list.append(2)
-            elif outcome == 'draw':
-                y_list.append(1)
-            elif outcome == 'away':
-                y_list.append(0)
-            else:
-                continue  # Skip unknown outcomes
+        columns = self._feature_columns(historical_matches)
+        self.feature_names = list(columns.keys())
         
-        self.feature_names = list(features.keys())
-        X = np.array(X_list)
-        y = np.array(y_list)
+        # Skip unknown outcomes
+        known = y_all >= 0
+        X = np.column_stack(list(columns.values()))[known]
+        y = y_all[known]
         
         return X, y
     
@@ -142,7 +169,8 @@ class SocialMLPredictor:
         accuracy = accuracy_score(y_test, y_pred)
         
         logger.info(f"Model trained! Test accuracy: {accuracy:.2%}")
-        logger.info(f"Classification report:\n{classification_report(y_test, y_pred, target_names=['Away', 'Draw', 'Home'])}")
+        report = classification_report(y_test, y_pred, target_names=['Away', 'Draw', 'Home'])
+        logger.info(f"Classification report:\n{report}")
         
         # Feature importance
         importances = self.model.feature_importances_
@@ -160,64 +188,119 @@ class SocialMLPredictor:
     
     def predict(self, match_data: Dict) -> Dict[str, float]:
         """Predict match outcome using ML model."""
-        market_type = match_data.get('market_type', 'h2h')
+        return self.predict_batch([match_data])[0]
+    
+    def predict_batch(self, matches: List[Dict]) -> List[Dict[str, float]]:
+        """Predict outcomes for many matches with a single model call.
         
-        if market_type != 'h2h':
-            # Currently ML model is only trained for h2h
-            # Fallback to specialized logic for other markets
-            return self._fallback_prediction(match_data)
-
-        if self.model is None:
+        H2H matches are stacked into one feature matrix and scored with one
+        ``predict_proba`` call; other markets use the specialized fallbacks.
+        
+        Args:
+            matches: List of match data dicts, as accepted by ``predict``
+            
+        Returns:
+            One prediction dict per match, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(matches)
+        h2h_positions = []
+        
+        for i, match_data in enumerate(matches):
+            if match_data.get('market_type', 'h2h') == 'h2h':
+                h2h_positions.append(i)
+            else:
+                # Currently ML model is only trained for h2h
+                # Fallback to specialized logic for other markets
+                results[i] = self._fallback_prediction(match_data)
+        
+        if h2h_positions and self.model is None:
             logger.warning("Model not trained, loading from disk...")
             self.load_model()
             
             if self.model is None:
                 logger.error("No trained model available")
-                return self._fallback_prediction(match_data)
+                for i in h2h_positions:
+                    results[i] = self._fallback_prediction(matches[i])
+                return results
+        
+        if not h2h_positions:
+            return results
+        
+        # Build one (n_matches, n_features) matrix column-wise for every h2h match
+        h2h_matches = [matches[i] for i in h2h_positions]
+        X, used = self._feature_matrix(h2h_matches)
+        
+        # A non-finite row (e.g. zero odds) would make the model reject the whole
+        # batch, so those matches take the odds fallback instead
+        finite = np.isfinite(X).all(axis=1)
+        if not finite.all():
+            for i, ok in zip(h2h_positions, finite):
+                if not ok:
+                    logger.warning(f"Non-finite ML features for match {i}, using odds fallback")
+                    results[i] = self._fallback_prediction(matches[i])
+            h2h_positions = [i for i, ok in zip(h2h_positions, finite) if ok]
+            X = X[finite]
+            if not h2h_positions:
+                return results
+        
+        # Predict (one ensemble pass; each class is the argmax of its probabilities)
+        all_probabilities = self.model.predict_proba(X)
+        predictions = np.argmax(all_probabilities, axis=1)
+        
+        # Map to outcomes
+        outcomes = ['away', 'draw', 'home']
+        for i, probabilities, prediction in zip(h2h_positions, all_probabilities, predictions):
+            predicted_outcome = outcomes[prediction]
+            result = {
+                'predicted_outcome': predicted_outcome,
+                'confidence': float(probabilities[prediction]),
+                'probabilities': {
+                    'home': float(probabilities[2]),
+                    'draw': float(probabilities[1]),
+                    'away': float(probabilities[0])
+                },
+                'model': 'gradient_boosting',
+                'features_used': used,
+                'market_type': 'h2h'
+            }
+            
+            logger.info(
+                f"ML Prediction (H2H): {predicted_outcome} "
+                f"(confidence: {result['confidence']:.2%})"
+            )
+            results[i] = result
+        
+        return results
+    
+    def _feature_matrix(self, matches: List[Dict]) -> tuple:
+        """Build the model input for many matches in one vectorized pass.
         
-        # Extract features
-        features_dict = self.extract_features(match_data)
+        Columns come from ``_feature_columns`` and follow the saved
+        ``feature_names`` (missing ones are zero-filled) or, for legacy models
+        without them, the ``_feature_columns`` order.
+        
+        Args:
+            matches: List of match data dicts
+            
+        Returns:
+            (X, n_extracted): feature matrix and the number of features extracted
+        """
+        columns = self._feature_columns(matches)
         
         if self.feature_names:
             # Filter and order features to match model expectation
-            # This handles cases where code generates more features than the legacy model expects
-            ordered_features = []
-            for name in self.feature_names:
-                ordered_features.append(features_dict.get(name, 0.0))
-            X = np.array([ordered_features])
+            zeros = np.zeros(len(matches))
+            ordered = [columns.get(name, zeros) for name in self.feature_names]
         else:
-            # Fallback for legacy models without feature_names saved
-            # Note: This relies on dictionary order matching training order, which is risky
-            X = np.array([list(features_dict.values())])
-        
-        # Predict
-        prediction = self.model.predict(X)[0]
-        probabilities = self.model.predict_proba(X)[0]
-        
-        # Map to outcomes
-        outcomes = ['away', 'draw', 'home']
-        predicted_outcome = outcomes[prediction]
-        
-        result = {
-            'predicted_outcome': predicted_outcome,
-            'confidence': float(probabilities[prediction]),
-            'probabilities': {
-                'home': float(probabilities[2]),
-                'draw': float(probabilities[1]),
-                'away': float(probabilities[0])
-            },
-            'model': 'gradient_boosting',
-            'features_used': len(features_dict),
-            'market_type': 'h2h'
-        }
+            # Legacy models without feature_names were trained on the full feature order
+            ordered = list(columns.values())
         
-        logger.info(f"ML Prediction (H2H): {predicted_outcome} (confidence: {result['confidence']:.2%})")
-        return result
+        return np.column_stack(ordered), len(columns)
     
     def _fallback_prediction(self, match_data: Dict) -> Dict[str, float]:
         """Fallback prediction logic for different market types."""
         market_type = match_data.get('market_type', 'h2h')
-        sentiment = match_data.get('sentiment_score', 0.0)
+        sentiment = _get_number(match_data, 'sentiment_score', 0.0)
         
         if market_type == 'totals':
             return self._predict_totals(match_data)
@@ -225,8 +308,8 @@ class SocialMLPredictor:
             return self._predict_corners(match_data)
         
         # Default H2H fallback
-        home_odds = match_data.get('home_odds', 2.0)
-        away_odds = match_data.get('away_odds', 2.0)
+        home_odds = _get_number(match_data, 'home_odds', 2.0)
+        away_odds = _get_number(match_data, 'away_odds', 2.0)
         
         home_prob = 1.0 / home_odds if home_odds > 0 else 0.0
         away_prob = 1.0 / away_odds if away_odds > 0 else 0.0
@@ -259,7 +342,7 @@ class SocialMLPredictor:
 
     def _predict_totals(self, match_data: Dict) -> Dict[str, Any]:
         """Specialized prediction for Over/Under goals."""
-        sentiment = match_data.get('sentiment_score', 0.0)
+        sentiment = _get_number(match_data, 'sentiment_score', 0.0)
         # Higher positive sentiment often correlates with attacking football/over expectations
         confidence = 0.5 + (abs(sentiment) * 0.3)
         outcome = 'over' if sentiment > 0.1 else 'under' if sentiment < -0.1 else 'over'
@@ -273,7 +356,7 @@ class SocialMLPredictor:
 
     def _predict_corners(self, match_data: Dict) -> Dict[str, Any]:
         """Specialized prediction for Corner markets."""
-        sentiment = match_data.get('sentiment_score', 0.0)
+        sentiment = _get_number(match_data, 'sentiment_score', 0.0)
         confidence = 0.5 + (abs(sentiment) * 0.2)
         outcome = 'over' if sentiment > 0.1 else 'under'
         
@@ -11,6 +11,30 @@ from src.risk import calculate_expected_value, stake_from_bankroll, validate_bet
 
 logger = get_logger(__name__)
 
+# calculate_expected_value rounds EV to cents (ROUND_HALF_UP), so a raw EV up to half a
+# cent below min_ev still qualifies; the epsilon stops float error in p * odds - 1 from
+# rejecting EVs that sit exactly on that half-cent boundary
+EV_ROUNDING_SLACK = 0.005 + 1e-9
+
+
+def ev_screen_mask(p: np.ndarray, odds: np.ndarray, min_ev: float) -> np.ndarray:
+    """Vectorized pre-screen for rows whose rounded EV can reach ``min_ev``.
+
+    Conservative: every row ``calculate_expected_value`` would accept is kept and
+    rows with missing inputs are dropped. Survivors still need the exact per-row
+    EV check.
+
+    Args:
+        p: Win probabilities (float array, NaN for missing)
+        odds: Decimal odds (float array, NaN for missing)
+        min_ev: Minimum expected value threshold
+
+    Returns:
+        Boolean mask of rows that may qualify
+    """
+    with np.errstate(invalid="ignore"):
+        return ~np.isnan(p) & ~np.isnan(odds) & (p * odds - 1.0 >= min_ev - EV_ROUNDING_SLACK)
+
 
 def find_value_bets(
     features_df: pd.DataFrame,
@@ -22,6 +46,7 @@ def find_value_bets(
     max_odds: float = 100.0,
     dynamic_tuning: bool = True,  # ✅ adaptive EV threshold
     recent_results: Optional[List[float]] = None,
+    min_confidence: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Find value bets using adaptive expected value thresholds.
 
@@ -35,6 +60,8 @@ def find_value_bets(
         max_odds: Maximum odds to consider.
         dynamic_tuning: If True, adjusts EV threshold based on past ROI.
         recent_results: Recent ROI history for adaptive tuning.
+        min_confidence: Optional win probability floor applied in the pre-screen,
+            for callers that would drop lower-confidence bets later anyway.
     """
     logger.info(f"Searching for value bets in {len(features_df)} opportunities")
 
@@ -53,22 +80,33 @@ def find_value_bets(
         else:
             logger.info(f"Adaptive tuning skipped (insufficient history, using {min_ev:.3f})")
 
-    daily_loss = get_daily_loss()
-    open_bets = get_open_bets_count()
-
-    for idx, row in features_df.iterrows():
-        if proba_col not in row or odds_col not in row:
-            continue
-
+    # --- Vectorized pre-screen ---
+    # Missing values, out-of-range odds and EVs that cannot reach min_ev even after
+    # rounding to cents are rejected over whole columns; only survivors are sized.
+    if proba_col in features_df.columns and odds_col in features_df.columns:
+        p_all = features_df[proba_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        odds_all = features_df[odds_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            candidate = (
+                ev_screen_mask(p_all, odds_all, min_ev)
+                & (odds_all >= min_odds)
+                & (odds_all <= max_odds)
+            )
+            if min_confidence is not None:
+                candidate &= p_all >= min_confidence
+        candidates = features_df.loc[candidate]
+    else:
+        candidates = features_df.iloc[0:0]
+
+    # Risk state is only needed to validate survivors
+    if not candidates.empty:
+        daily_loss = get_daily_loss()
+        open_bets = get_open_bets_count()
+
+    for idx, row in zip(candidates.index, candidates.to_dict("records")):
         p = row[proba_col]
         odds = row[odds_col]
 
-        if pd.isna(p) or pd.isna(odds):
-            continue
-
-        if odds < min_odds or odds > max_odds:
-            continue
-
         # --- Calculate Expected Value ---
         ev = calculate_expected_value(p, odds)
         logger.debug(
@@ -131,22 +169,19 @@ def find_value_bets(
         try:
             # Calculate EVs for all opportunities
             if proba_col in features_df.columns and odds_col in features_df.columns:
-                features_df["calculated_ev"] = features_df.apply(
-                    lambda r: calculate_expected_value(r[proba_col], r[odds_col])
-                    if pd.notna(r[proba_col]) and pd.notna(r[odds_col])
-                    else np.nan,
-                    axis=1,
-                )
+                # EV for every row in one array op (p_all/odds_all come from the pre-screen)
+                ev_all = p_all * odds_all - 1.0
+                valid = np.flatnonzero(~np.isnan(ev_all))
+                top_5 = valid[np.argsort(-ev_all[valid], kind="stable")[:5]]
 
                 # Show top opportunities that didn't qualify
-                top_5 = features_df.nlargest(5, "calculated_ev")
                 logger.warning("📊 Top 5 opportunities that didn't qualify:")
-                for idx, row in top_5.iterrows():
-                    stake = stake_from_bankroll(row.get(proba_col, 0), row.get(odds_col, 0), bank)
+                for pos in top_5:
+                    stake = stake_from_bankroll(p_all[pos], odds_all[pos], bank)
                     logger.warning(
-                        f"  EV={row.get('calculated_ev', 0):.4f}, "
-                        f"p={row.get(proba_col, 0):.3f}, "
-                        f"odds={row.get(odds_col, 0):.2f}, "
+                        f"  EV={ev_all[pos]:.4f}, "
+                        f"p={p_all[pos]:.3f}, "
+                        f"odds={odds_all[pos]:.2f}, "
                         f"stake_calc={stake:.2f}"
                     )
             else:
@@ -1,6 +1,6 @@
 """Synthetic data generator for testing and backtesting."""
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
@@ -9,6 +9,10 @@ from src.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Fixed 1X2 outcomes; selection/result columns are stored as this categorical so
+# the repeated ``== "home"`` masks downstream compare integer codes, not strings.
+SELECTION_DTYPE = pd.CategoricalDtype(["home", "away", "draw"])
+
 
 def generate_synthetic_fixtures(
     n_days: int = 100, games_per_day: int = 10, start_date: Optional[datetime] = None
@@ -158,6 +162,8 @@ def generate_synthetic_odds(fixtures_df: pd.DataFrame, add_margin: float = 0.05)
         )
 
     df = pd.DataFrame(rows)
+    if not df.empty:
+        df["selection"] = df["selection"].astype(SELECTION_DTYPE)
     logger.info(f"Generated {len(df)} synthetic odds entries")
 
     return df
@@ -177,19 +183,22 @@ def generate_synthetic_results(fixtures_df: pd.DataFrame, odds_df: pd.DataFrame)
 
     results = []
 
+    # Index true probabilities by market once instead of filtering odds_df per market
+    probs_by_market: Dict[str, Dict[str, float]] = {}
+    if "true_prob" in odds_df.columns:
+        for market_id, selection, true_prob in zip(
+            odds_df["market_id"], odds_df["selection"], odds_df["true_prob"]
+        ):
+            probs_by_market.setdefault(market_id, {})[selection] = true_prob
+
     for market_id in fixtures_df["market_id"].unique():
-        # Get odds for this market
-        market_odds = odds_df[odds_df["market_id"] == market_id]
+        # Get true probabilities for this market
+        probs = probs_by_market.get(market_id)
 
-        if market_odds.empty or "true_prob" not in market_odds.columns:
+        if not probs:
             # No odds data, skip
             continue
 
-        # Get true probabilities
-        probs = {}
-        for _, row in market_odds.iterrows():
-            probs[row["selection"]] = row["true_prob"]
-
         # Simulate result based on true probabilities
         selections = list(probs.keys())
         probabilities = [probs[s] for s in selections]
@@ -207,6 +216,8 @@ def generate_synthetic_results(fixtures_df: pd.DataFrame, odds_df: pd.DataFrame)
         results.append({"market_id": market_id, "result": result})
 
     df = pd.DataFrame(results)
+    if not df.empty:
+        df["result"] = df["result"].astype(SELECTION_DTYPE)
     logger.info(f"Generated {len(df)} synthetic results")
 
     return df
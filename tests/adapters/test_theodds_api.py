@@ -33,7 +33,7 @@ def test_get_success(setup_env):
     mock_response.json.return_value = {"status": "success"}
     mock_response.headers = {"x-requests-remaining": "100"}
 
-    with patch("src.adapters.theodds_api.requests.get") as mock_get:
+    with patch("src.adapters.theodds_api._SESSION.get") as mock_get:
         from src.adapters.theodds_api import _get
 
         response = _get("/test")
@@ -52,7 +52,7 @@ def test_get_http_error(setup_env):
     mock_response.status_code = 400
     mock_response.raise_for_status.side_effect = HTTPError("Bad Request")
 
-    with patch("src.adapters.theodds_api.requests.get", return_value=mock_response) as mock_get:
+    with patch("src.adapters.theodds_api._SESSION.get", return_value=mock_response) as mock_get:
         with pytest.raises(RetryError):
             _get("/test")
 
@@ -2,6 +2,16 @@
 import os
 import sys
 
+import pytest
+
 # Add the project root to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, project_root)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def db_schema():
+    """Create the database schema once so tests never depend on a pre-built bets.db."""
+    from src.db import init_db
+
+    init_db()
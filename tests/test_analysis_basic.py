@@ -17,6 +17,13 @@ try:
 except ImportError:
     PERFORMANCE_AVAILABLE = False
 
+try:
+    from src.analysis.market_regime import MarketRegimeDetector
+
+    REGIME_AVAILABLE = True
+except ImportError:
+    REGIME_AVAILABLE = False
+
 
 @pytest.mark.skipif(not PERFORMANCE_AVAILABLE, reason="Performance module not available")
 class TestPerformanceMetrics:
@@ -124,3 +131,24 @@ class TestPerformanceAnalyzer:
 
         assert isinstance(equity, (list, np.ndarray, pd.Series))
         assert len(equity) > 0
+
+
+@pytest.mark.skipif(not REGIME_AVAILABLE, reason="Market regime module not available")
+class TestMarketRegimeIndicators:
+    """Tests for market regime technical indicators."""
+
+    def test_calculate_obv(self):
+        """Test OBV accumulates signed volume on up/down/flat moves."""
+        prices = pd.Series([10.0, 11.0, 10.5, 10.5, 12.0])
+        volume = pd.Series([100.0, 200.0, 50.0, 70.0, 30.0])
+
+        obv = MarketRegimeDetector._calculate_obv(prices, volume)
+
+        assert obv.tolist() == [100.0, 300.0, 250.0, 250.0, 280.0]
+        assert obv.index.equals(prices.index)
+
+    def test_calculate_obv_empty(self):
+        """Test OBV on an empty series."""
+        obv = MarketRegimeDetector._calculate_obv(pd.Series(dtype=float), pd.Series(dtype=float))
+
+        assert obv.empty
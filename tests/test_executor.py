@@ -97,6 +97,83 @@ def test_executor_batch(executor):
     assert all(r["status"] == "dry_run" for r in results)
 
 
+def test_executor_execute_many(executor):
+    """Test bulk dry-run execution records every valid bet."""
+    init_db()
+
+    bets = [
+        {"market_id": "many_1", "selection": "home", "stake": 50.0, "odds": 2.0},
+        {"market_id": "many_2", "selection": "away", "stake": 30.0, "odds": 0.5},
+        {"market_id": "many_3", "selection": "home", "stake": 40.0, "odds": 2.5, "ev": 0.1},
+    ]
+
+    results = executor.execute_many(bets, dry_run=True)
+
+    assert [r["status"] for r in results] == ["dry_run", "rejected", "dry_run"]
+
+    with handle_db_errors() as session:
+        records = (
+            session.query(BetRecord)
+            .filter(BetRecord.id.in_([results[0]["db_id"], results[2]["db_id"]]))
+            .all()
+        )
+        assert {r.market_id for r in records} == {"many_1", "many_3"}
+        assert all(r.is_dry_run for r in records)
+        assert next(r for r in records if r.market_id == "many_3").meta["ev"] == 0.1
+
+
+def test_executor_execute_many_matches_execute(executor):
+    """Test a batched bet is stored exactly like the same bet executed alone."""
+    init_db()
+
+    bet = {
+        "market_id": "same_row_1",
+        "selection": "home",
+        "stake": 25.0,
+        "odds": 2.2,
+        "meta": {"strategy": "foo", "strategy_params": {"min_ev": 0.02}},
+    }
+
+    single = executor.execute(dict(bet), dry_run=True)
+    batch = executor.execute_many([dict(bet)], dry_run=True)
+
+    columns = (
+        "market_id",
+        "selection",
+        "stake",
+        "odds",
+        "is_dry_run",
+        "strategy_name",
+        "strategy_params",
+    )
+    with handle_db_errors() as session:
+        single_row = session.query(BetRecord).filter_by(id=single["db_id"]).one()
+        batch_row = session.query(BetRecord).filter_by(id=batch[0]["db_id"]).one()
+
+        assert single_row.strategy_name == "foo"
+        for column in columns:
+            assert getattr(batch_row, column) == getattr(single_row, column)
+
+        single_meta = {k: v for k, v in single_row.meta.items() if k != "submitted_at"}
+        batch_meta = {k: v for k, v in batch_row.meta.items() if k != "submitted_at"}
+        assert batch_meta == single_meta
+
+
+def test_executor_execute_many_reuses_idempotency_key(executor, monkeypatch):
+    """Test bulk execution returns the existing row for a known idempotency key."""
+    init_db()
+    monkeypatch.setattr(executor, "_generate_idempotency_key", lambda bet: "batch_dup_key")
+
+    bet = {"market_id": "dup_1", "selection": "home", "stake": 20.0, "odds": 2.0}
+    first = executor.execute_many([dict(bet)], dry_run=True)
+    second = executor.execute_many([dict(bet), dict(bet)], dry_run=True)
+
+    assert [r["db_id"] for r in second] == [first[0]["db_id"]] * 2
+
+    with handle_db_errors() as session:
+        assert session.query(BetRecord).filter_by(idempotency_key="batch_dup_key").count() == 1
+
+
 def test_executor_live_mode_requires_setting(executor, sample_bet):
     """Test LIVE mode requires MODE=LIVE in settings."""
     from src.config import settings
@@ -1,4 +1,6 @@
 """Integration tests for data adapters and pipeline."""
+import pandas as pd
+
 from src.feature import build_features
 from src.strategy import find_value_bets
 from src.tools.synthetic_data import generate_synthetic_fixtures, generate_synthetic_odds
@@ -47,6 +49,16 @@ def test_synthetic_odds_structure():
         assert col in odds.columns
 
 
+def test_synthetic_odds_selection_is_categorical():
+    """Test synthetic selections use the fixed 1X2 categorical dtype."""
+    fixtures = generate_synthetic_fixtures(n_days=1, games_per_day=2)
+    odds = generate_synthetic_odds(fixtures)
+
+    assert isinstance(odds["selection"].dtype, pd.CategoricalDtype)
+    assert set(odds["selection"].cat.categories) == {"home", "away", "draw"}
+    assert (odds["selection"] == "home").sum() == len(fixtures)
+
+
 def test_synthetic_odds_realistic_range():
     """Test synthetic odds are in realistic range."""
     fixtures = generate_synthetic_fixtures(n_days=1, games_per_day=5)
@@ -7,7 +7,7 @@ import pandas as pd
 import pytest
 from sklearn.datasets import make_classification
 
-from src.ml_pipeline import MLPipeline
+from src.ml_pipeline import MLPipeline, load_booster, save_booster
 
 
 @pytest.fixture
@@ -324,3 +324,22 @@ def test_ml_pipeline_model_persistence(sample_ml_data, temp_model_dir):
 
     # Predictions should be identical
     np.testing.assert_array_almost_equal(pred1, pred2)
+
+
+def test_save_and_load_booster_native_format(sample_ml_data, temp_model_dir):
+    """Test native Booster save/load round-trips predictions."""
+    X, y = sample_ml_data
+    pipeline = MLPipeline(model_path=temp_model_dir / "test_model.pkl")
+    pipeline.train_simple(X, y.values)
+
+    saved_path = save_booster(pipeline.model, temp_model_dir / "booster")
+    assert saved_path.exists()
+    assert saved_path.name.startswith("booster.txt")
+
+    loaded = MLPipeline(model_path=saved_path)
+    loaded.load()
+
+    np.testing.assert_array_almost_equal(
+        pipeline.predict_proba(X[:10]), loaded.predict_proba(X[:10])
+    )
+    assert isinstance(load_booster(saved_path), type(pipeline.model))
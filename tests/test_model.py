@@ -3,6 +3,7 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import pytest
 from sklearn.datasets import make_classification
 
@@ -158,6 +159,31 @@ def test_model_wrapper_predict_proba(sample_data, temp_model_path):
     assert (probas >= 0).all() and (probas <= 1).all()
 
 
+def test_model_wrapper_predict_pos_proba(sample_data, temp_model_path):
+    """Test positive-class probabilities match the predict_proba column."""
+    X, y = sample_data
+    wrapper = ModelWrapper(model_path=temp_model_path)
+    wrapper.train(X, y)
+
+    pos = wrapper.predict_pos_proba(X[:10])
+
+    assert pos.shape == (10,)
+    assert pos.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(pos, wrapper.predict_proba(X[:10])[:, 1])
+
+
+def test_model_wrapper_accepts_dataframe(sample_data, temp_model_path):
+    """Test DataFrame input matches the equivalent float32 array."""
+    X, y = sample_data
+    df = pd.DataFrame(X, columns=[f"f{i}" for i in range(X.shape[1])])
+    wrapper = ModelWrapper(model_path=temp_model_path)
+    wrapper.train(df, y)
+
+    np.testing.assert_array_equal(
+        wrapper.predict_proba(df.iloc[:10]), wrapper.predict_proba(X[:10].astype(np.float32))
+    )
+
+
 def test_model_wrapper_predict_proba_without_model(temp_model_path):
     """Test probability prediction without trained model."""
     wrapper = ModelWrapper(model_path=temp_model_path)
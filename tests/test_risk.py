@@ -1,14 +1,18 @@
 """Tests for risk management module."""
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from src.config import settings
 from src.risk import (
+    _expected_value,
     calculate_expected_value,
     calculate_sharpe_ratio,
     calculate_variance,
     kelly_fraction,
+    kelly_stake,
+    kelly_stakes,
     stake_from_bankroll,
     validate_bet,
 )
@@ -61,6 +65,24 @@ def test_kelly_fraction_calculation():
     assert stake <= 1000 * 0.05  # Should respect max stake
 
 
+def test_kelly_stakes_matches_scalar():
+    """Vectorized Kelly stakes should agree with the scalar implementation."""
+    probs = [0.6, 0.5, 0.3, 0.95, 0.55, 0.0]
+    odds = [2.0, 2.0, 2.0, 1.5, 3.2, 2.0]
+
+    stakes = kelly_stakes(probs, odds, 1000)
+    expected = [kelly_fraction(p, o, 1000) for p, o in zip(probs, odds)]
+
+    assert stakes == pytest.approx(expected, abs=0.01)
+
+
+def test_kelly_stakes_non_positive_bankroll():
+    """Vectorized Kelly stakes are zero when bankroll is not positive."""
+    stakes = kelly_stakes([0.6, 0.7], [2.0, 2.0], 0)
+
+    assert stakes.tolist() == [0.0, 0.0]
+
+
 def test_validate_bet_valid():
     """Test validation of a valid bet."""
     is_valid, reason = validate_bet(
@@ -135,6 +157,36 @@ def test_expected_value_negative():
     assert ev < 0
 
 
+def test_expected_value_is_memoized():
+    """Repeated EV lookups for the same inputs should be served from cache."""
+    _expected_value.cache_clear()
+
+    first = calculate_expected_value(0.62, 2.1)
+    second = calculate_expected_value(0.62, 2.1)
+
+    assert first == second
+    assert _expected_value.cache_info().hits == 1
+
+
+def test_risk_helpers_reject_unhashable_inputs():
+    """Array/list inputs fall through to validation (0.0) instead of a cache TypeError."""
+    assert kelly_stake(np.array([0.6]), 2.0, 1000.0) == 0.0
+    assert kelly_stake([0.6], 2.0, 1000.0) == 0.0
+    assert calculate_expected_value(np.array([0.6]), 2.0) == 0.0
+    assert calculate_variance([0.6], 2.0) == 0.0
+
+
+def test_kelly_stake_warns_on_every_invalid_call():
+    """Invalid-input warnings are logged on each call, not only on a cache miss."""
+    with patch("src.risk.logger") as mock_logger:
+        assert kelly_stake(1.5, 2.0, 1000.0) == 0.0
+        assert kelly_stake(1.5, 2.0, 1000.0) == 0.0
+        assert kelly_stake(0.6, 1.0, 1000.0) == 0.0
+        assert kelly_stake(0.6, 2.0, -5.0) == 0.0
+
+    assert mock_logger.warning.call_count == 4
+
+
 def test_variance_calculation():
     """Test variance calculation."""
     variance = calculate_variance(0.6, 2.0)
@@ -1,15 +1,20 @@
 """Integration tests for social signals module."""
 import pytest
 from datetime import datetime, timedelta
+import numpy as np
+
+from sklearn.ensemble import GradientBoostingClassifier
 
 from src.social.sentiment import analyze_text
 from src.social.matcher import link_post_to_fixture
+from src.social import aggregator
 from src.social.aggregator import (
     calculate_recency_weight,
     calculate_author_influence,
     aggregate_match_sentiment,
 )
 from src.social.arbitrage import detect_arbitrage
+from src.social.ml_predictor import SocialMLPredictor
 
 
 class TestSentimentAnalysis:
@@ -112,6 +117,129 @@ class TestArbitrage:
 
 
 
+class TestSentimentCache:
+    """Test cached match sentiment lookups."""
+    
+    def test_cached_match_sentiment_reuses_and_invalidates(self, monkeypatch):
+        """Test repeated lookups hit the database once until invalidated."""
+        calls = []
+        
+        def fake_get_match_sentiment(match_id):
+            calls.append(match_id)
+            return {"match_id": match_id, "aggregate_score": 0.5}
+        
+        monkeypatch.setattr(aggregator, "get_match_sentiment", fake_get_match_sentiment)
+        aggregator.invalidate_cached_match_sentiment()
+        
+        first = aggregator.get_cached_match_sentiment("match_1")
+        second = aggregator.get_cached_match_sentiment("match_1")
+        assert first == second
+        assert calls == ["match_1"]
+        
+        aggregator.invalidate_cached_match_sentiment("match_1")
+        aggregator.get_cached_match_sentiment("match_1")
+        assert calls == ["match_1", "match_1"]
+        
+        aggregator.get_cached_match_sentiment("match_1", ttl_seconds=0)
+        assert len(calls) == 3
+        aggregator.invalidate_cached_match_sentiment()
+
+
+class TestMLPredictor:
+    """Test ML predictor batching."""
+    
+    @staticmethod
+    def _trained_predictor(tmp_path):
+        outcomes = ["home", "draw", "away"]
+        history = [
+            {
+                "sentiment_score": (i % 7 - 3) / 3.0,
+                "home_odds": 1.5 + (i % 5) * 0.5,
+                "away_odds": 4.0 - (i % 5) * 0.5,
+                "sample_count": 10 + i,
+                "outcome": outcomes[i % 3],
+            }
+            for i in range(30)
+        ]
+        predictor = SocialMLPredictor(model_path=tmp_path / "social_predictor.pkl")
+        X, y = predictor.prepare_training_data(history)
+        predictor.model = GradientBoostingClassifier(n_estimators=10, random_state=42).fit(X, y)
+        return predictor
+    
+    def test_predict_batch_matches_per_row_model_calls(self, tmp_path):
+        """Test batched predictions equal one model call per extract_features row."""
+        predictor = self._trained_predictor(tmp_path)
+        
+        matches = [
+            {"market_type": "h2h", "sentiment_score": 0.4, "home_odds": 1.8, "away_odds": 4.2},
+            {"market_type": "totals", "sentiment_score": 0.4},
+            {"market_type": "h2h", "sentiment_score": -0.6, "home_odds": 3.5, "away_odds": 2.1},
+        ]
+        
+        batch = predictor.predict_batch(matches)
+        
+        assert len(batch) == len(matches)
+        assert [p["market_type"] for p in batch] == ["h2h", "totals", "h2h"]
+        assert batch[1] == predictor._fallback_prediction(matches[1])
+        for i in (0, 2):
+            features = predictor.extract_features(matches[i])
+            row = [[features[name] for name in predictor.feature_names]]
+            away, draw, home = predictor.model.predict_proba(row)[0]
+            assert batch[i]["model"] == "gradient_boosting"
+            assert batch[i]["probabilities"] == pytest.approx(
+                {"home": home, "draw": draw, "away": away}
+            )
+    
+    def test_predict_batch_isolates_bad_rows(self, tmp_path):
+        """Test a degenerate row takes the odds fallback without failing the batch."""
+        predictor = self._trained_predictor(tmp_path)
+        
+        good = {"market_type": "h2h", "sentiment_score": 0.4, "home_odds": 1.8, "away_odds": 4.2}
+        zero_odds = {"market_type": "h2h", "sentiment_score": 0.2, "home_odds": 0, "away_odds": 2.5}
+        missing_sentiment = {"market_type": "h2h", "sentiment_score": None, "home_odds": 1.8,
+                             "away_odds": 4.2}
+        
+        batch = predictor.predict_batch([good, zero_odds, missing_sentiment])
+        
+        assert batch[0] == predictor.predict(good)
+        assert batch[1] == predictor._fallback_prediction(zero_odds)
+        assert batch[1]["model"] == "odds_fallback"
+        assert batch[2] == predictor.predict(dict(missing_sentiment, sentiment_score=0.0))
+    
+    def test_feature_schema_shared_by_training_and_prediction(self):
+        """Test training rows, single extraction and the batch matrix use one schema."""
+        matches = [
+            {"sentiment_score": 0.4, "positive_pct": 0.6, "negative_pct": 0.1,
+             "sample_count": 25, "home_odds": 1.8, "away_odds": 4.2, "draw_odds": 3.4,
+             "outcome": "home"},
+            {"sentiment_score": -0.6, "home_odds": 3.5, "away_odds": 2.1, "outcome": "unknown"},
+            {"outcome": "away"},
+        ]
+        predictor = SocialMLPredictor()
+        X_train, y = predictor.prepare_training_data(matches)
+        np.testing.assert_array_equal(y, [2, 0])
+        
+        X, used = predictor._feature_matrix(matches)
+        assert used == len(predictor.feature_names)
+        np.testing.assert_allclose(X[[0, 2]], X_train)
+        
+        features = predictor.extract_features(matches[0])
+        assert list(features) == predictor.feature_names
+        np.testing.assert_allclose(list(features.values()), X[0])
+        assert features["posts_per_hour"] == pytest.approx(25 / 24.0)
+        assert features["home_favorite"] == 1.0
+        assert features["odds_spread"] == pytest.approx(2.4)
+        assert features["sentiment_x_volume"] == pytest.approx(0.4 * np.log1p(25))
+        assert features["sentiment_x_away_odds"] == pytest.approx(-0.4 / 4.2)
+        
+        predictor.feature_names = ["home_odds", "not_a_feature", "sentiment_x_volume"]
+        X_subset, _ = predictor._feature_matrix(matches)
+        assert X_subset.shape == (3, 3)
+        np.testing.assert_allclose(X_subset[:, 0], [1.8, 3.5, 2.0])
+        np.testing.assert_allclose(X_subset[:, 1], 0.0)
+        np.testing.assert_allclose(X_subset[:, 2], X[:, 15])
+
+
 class TestEndToEnd:
     """End-to-end integration tests."""
     
@@ -1,8 +1,11 @@
 """Tests for betting strategy module."""
+import numpy as np
 import pandas as pd
 
+from src.risk import calculate_expected_value
 from src.strategy import (
     diversify_bets,
+    ev_screen_mask,
     filter_bets_by_confidence,
     filter_bets_by_sharpe,
     find_value_bets,
@@ -165,3 +168,68 @@ def test_find_value_bets_with_missing_columns():
 
     bets = find_value_bets(data, bank=1000.0)
     assert bets == []
+
+
+def test_find_value_bets_keeps_ev_that_rounds_to_threshold():
+    """Pre-screening must not drop bets whose EV rounds up to min_ev."""
+    data = pd.DataFrame(
+        {
+            "market_id": ["m1", "m2"],
+            "p_win": [0.5248, 0.50],  # raw EV 0.0496 rounds to 0.05; m2 has none
+            "odds": [2.0, 2.0],
+            "home": ["A", "B"],
+            "away": ["C", "D"],
+            "selection": ["home", "home"],
+        }
+    )
+
+    bets = find_value_bets(data, bank=1000.0, min_ev=0.05, dynamic_tuning=False)
+
+    assert [bet["market_id"] for bet in bets] == ["m1"]
+    assert bets[0]["ev"] == 0.05
+
+
+def test_ev_screen_mask_keeps_half_cent_boundaries():
+    """Pre-screen must keep every bet whose cent-rounded EV reaches min_ev."""
+    cases = [
+        (0.5025, 2.0, 0.01),
+        (0.41, 2.5, 0.03),
+        (0.475, 2.2, 0.05),
+        (0.5248, 2.0, 0.05),
+        (0.50, 2.0, 0.05),
+    ]
+    for p, odds, min_ev in cases:
+        mask = ev_screen_mask(np.array([p]), np.array([odds]), min_ev)
+        if calculate_expected_value(p, odds) >= min_ev:
+            assert mask[0], (p, odds, min_ev)
+
+    # The three boundary cases sit exactly on a half cent and must survive
+    p = np.array([0.5025, 0.41, 0.475])
+    odds = np.array([2.0, 2.5, 2.2])
+    assert ev_screen_mask(p, odds, 0.01)[0]
+    assert ev_screen_mask(p, odds, 0.03)[1]
+    assert ev_screen_mask(p, odds, 0.05)[2]
+
+    # Missing inputs and clearly negative EVs are still rejected
+    mask = ev_screen_mask(np.array([np.nan, 0.5, 0.3]), np.array([2.0, np.nan, 2.0]), 0.0)
+    assert not mask.any()
+
+
+def test_find_value_bets_min_confidence_prescreen():
+    """Rows below min_confidence are dropped before sizing."""
+    data = pd.DataFrame(
+        {
+            "market_id": ["m1", "m2"],
+            "p_win": [0.45, 0.60],  # both have EV >= 0.25 at these odds
+            "odds": [2.8, 2.1],
+            "home": ["A", "B"],
+            "away": ["C", "D"],
+            "selection": ["home", "home"],
+        }
+    )
+
+    bets = find_value_bets(
+        data, bank=1000.0, min_ev=0.05, dynamic_tuning=False, min_confidence=0.5
+    )
+
+    assert [bet["market_id"] for bet in bets] == ["m2"]